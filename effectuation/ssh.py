@@ -19,15 +19,82 @@
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List
 import wmill
 
 logger = logging.getLogger(__name__)
 
 
-def main(targets: List[Dict[str, Any]], playbook_path: str, playbook_vars: Dict[str, Any], stabilization_seconds: int = 0) -> Dict[str, Any]:
+def _process_target(target: Dict[str, Any], playbook_path: str, playbook_vars: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Apply configuration to a single target
+
+    Failures are captured in the returned result dict so that one failing
+    target does not cancel its siblings when run from the thread pool.
+
+    Args:
+        target: Target configuration (see main)
+        playbook_path: Windmill path to the Ansible playbook to execute
+        playbook_vars: Variables to pass to the Ansible playbook
+
+    Returns:
+        Result dictionary for this target
+    """
+    target_id = target.get('id')
+    address = target.get('address')
+    username = target.get('username', 'root')
+    ssh_key_path = target.get('ssh_key_variable_path')
+
+    logger.info("Processing target %s: %s", target_id, address)
+
+    try:
+        # Build variables for this target
+        # Note: playbook_vars contains all configuration parameters (e.g., qdisc, cpu_governor)
+        # The Ansible playbook expects them wrapped in a 'params' dict, not as separate kwargs
+        target_vars = {
+            'target_hostname': address,
+            'username': username,
+            'ssh_key_variable': ssh_key_path,
+            'params': playbook_vars  # Wrap configuration parameters in 'params' dict
+        }
+
+        # Execute Ansible playbook via Windmill (playbooks are scripts, not flows)
+        # Pass arguments via args parameter, not as kwargs
+        result = wmill.run_script_by_path(playbook_path, args=target_vars)
+
+        if result.get('success'):
+            return {
+                'target_id': target_id,
+                'address': address,
+                'success': True,
+                'result': result
+            }
+        else:
+            return {
+                'target_id': target_id,
+                'address': address,
+                'success': False,
+                'error': result.get('error', 'Unknown error')
+            }
+
+    except Exception as e:
+        logger.error("Failed to process target %s: %s", target_id, e, exc_info=True)
+        return {
+            'target_id': target_id,
+            'address': address,
+            'success': False,
+            'error': f"Target processing failed: {str(e)}"
+        }
+
+
+def main(targets: List[Dict[str, Any]], playbook_path: str, playbook_vars: Dict[str, Any], stabilization_seconds: int = 0,
+         max_workers: int = 32) -> Dict[str, Any]:
     """
     Apply configuration to targets via SSH using Windmill Ansible playbook
+
+    Targets are processed concurrently since each one is dominated by
+    SSH and playbook latency.
     
     Args:
         targets: List of target configurations with:
@@ -38,71 +105,39 @@ def main(targets: List[Dict[str, Any]], playbook_path: str, playbook_vars: Dict[
         playbook_path: Windmill path to the Ansible playbook to execute
         playbook_vars: Variables to pass to the Ansible playbook
         stabilization_seconds: Optional wait time after applying changes
+        max_workers: Maximum number of targets processed concurrently,
+            bounded further by the number of targets
     
     Returns:
         Dictionary with aggregated results and success status
     """
-    logger.info(f"Starting SSH effectuation for {len(targets)} targets")
-    logger.info(f"Playbook: {playbook_path}")
-    logger.info(f"Variables: {list(playbook_vars.keys())}")
+    logger.info("Starting SSH effectuation for %s targets", len(targets))
+    logger.info("Playbook: %s", playbook_path)
+    logger.info("Variables: %s", list(playbook_vars.keys()))
     
-    all_results = []
-    
-    for target in targets:
-        target_id = target.get('id')
-        address = target.get('address')
-        username = target.get('username', 'root')
-        ssh_key_path = target.get('ssh_key_variable_path')
-        
-        logger.info(f"Processing target {target_id}: {address}")
-        
-        try:
-            # Build variables for this target
-            # Note: playbook_vars contains all configuration parameters (e.g., qdisc, cpu_governor)
-            # The Ansible playbook expects them wrapped in a 'params' dict, not as separate kwargs
-            target_vars = {
-                'target_hostname': address,
-                'username': username,
-                'ssh_key_variable': ssh_key_path,
-                'params': playbook_vars  # Wrap configuration parameters in 'params' dict
-            }
+    # Results are slotted by target position so the summary keeps the
+    # order of the input targets regardless of completion order
+    all_results = [None] * len(targets)
 
-            # Execute Ansible playbook via Windmill (playbooks are scripts, not flows)
-            # Pass arguments via args parameter, not as kwargs
-            result = wmill.run_script_by_path(playbook_path, args=target_vars)
-            
-            if result.get('success'):
-                all_results.append({
-                    'target_id': target_id,
-                    'address': address,
-                    'success': True,
-                    'result': result
-                })
-            else:
-                all_results.append({
-                    'target_id': target_id,
-                    'address': address,
-                    'success': False,
-                    'error': result.get('error', 'Unknown error')
-                })
-                
-        except Exception as e:
-            logger.error(f"Failed to process target {target_id}: {e}", exc_info=True)
-            all_results.append({
-                'target_id': target_id,
-                'address': address,
-                'success': False,
-                'error': f"Target processing failed: {str(e)}"
-            })
+    if targets:
+        pool_size = max(1, min(max_workers, len(targets)))
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            futures = [
+                executor.submit(_process_target, target, playbook_path, playbook_vars)
+                for target in targets
+            ]
+            for index, future in enumerate(futures):
+                all_results[index] = future.result()
     
     # Optional stabilization wait
     if stabilization_seconds > 0:
-        logger.info(f"Waiting {stabilization_seconds}s for system stabilization")
+        logger.info("Waiting %ss for system stabilization", stabilization_seconds)
         time.sleep(stabilization_seconds)
     
     # Aggregate results
-    success_count = sum(1 for r in all_results if r.get('success', False))
-    total_count = len(all_results)
+    successes = [r['success'] for r in all_results]
+    success_count = sum(successes)
+    total_count = len(successes)
     
     summary = {
         'status': 'completed',
@@ -112,6 +147,6 @@ def main(targets: List[Dict[str, Any]], playbook_path: str, playbook_vars: Dict[
         'results': all_results
     }
     
-    logger.info(f"Effectuation completed: {success_count}/{total_count} successful")
+    logger.info("Effectuation completed: %s/%s successful", success_count, total_count)
     
     return summary
\ No newline at end of file
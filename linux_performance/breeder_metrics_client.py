@@ -5,7 +5,7 @@ Thin wrapper around prometheus_client for Godon breeders.
 Simplifies pushing metrics to Prometheus Push Gateway.
 
 Dependencies:
-    pip install prometheus_client
+    pip install prometheus_client requests
 
 Usage:
     from f.breeder.linux_performance.breeder_metrics_client import BreederMetricsClient
@@ -14,15 +14,45 @@ Usage:
     metrics.mark_running()
     metrics.inc_trial('complete', value=0.85)
     metrics.push()
+    metrics.close()
 """
 
 import os
+import sys
 import logging
-from typing import Optional
+import threading
+from typing import Callable, List, Optional, Tuple
+import requests
 from prometheus_client import CollectorRegistry, Gauge, Counter, Histogram, push_to_gateway
 
 logger = logging.getLogger(__name__)
 
+# Push configuration, read once per process
+_PUSH_ENABLED = os.getenv("PUSH_METRICS_ENABLED", "true").lower() == "true"
+_DEFAULT_PUSHGW = os.getenv("PUSH_GATEWAY_URL", "http://pushgateway:9091")
+_DEFAULT_PUSH_INTERVAL = float(os.getenv("PUSH_METRICS_INTERVAL", "0"))
+
+# All breeders push under one job; each worker owns its own group within it
+_PUSH_JOB = 'godon_breeder'
+
+# Public metric-recording methods, replaced by no-ops on disabled clients
+_METRIC_METHODS = (
+    'mark_running', 'mark_stopped', 'inc_trial', 'set_best_value', 'set_total_trials',
+    'observe_trial_duration', 'inc_effectuation', 'inc_guardrail_violation',
+    'inc_rollback', 'inc_trial_shared',
+)
+
+# Exponential trial duration buckets: 1s, 2s, 4s, ... 2048s (~34min)
+_TRIAL_DURATION_BUCKETS = tuple(2 ** i for i in range(12))
+
+
+def _noop(*args, **kwargs):
+    return None
+
+
+def _push_disabled() -> bool:
+    return False
+
 
 class BreederMetricsClient:
     """
@@ -33,7 +63,7 @@ class BreederMetricsClient:
     """
 
     def __init__(self, breeder_id: str, worker_id: str, breeder_type: str,
-                 pushgateway_url: Optional[str] = None):
+                 pushgateway_url: Optional[str] = None, push_interval: Optional[float] = None):
         """
         Initialize metrics client for a breeder worker.
 
@@ -42,23 +72,55 @@ class BreederMetricsClient:
             worker_id: Unique worker identifier
             breeder_type: Type of breeder (e.g., 'linux_performance')
             pushgateway_url: Push Gateway URL (default from env or http://pushgateway:9091)
+            push_interval: Seconds between background pushes (default from env
+                PUSH_METRICS_INTERVAL or 0). With 0, push() sends synchronously;
+                otherwise push() only requests a push, and a background thread
+                coalesces requests into at most one push per interval.
         """
-        self.breeder_id = breeder_id
-        self.worker_id = worker_id
-        self.breeder_type = breeder_type
+        # Interned so label dicts and child cache keys reuse one cached hash
+        self.breeder_id = breeder_id = sys.intern(breeder_id)
+        self.worker_id = worker_id = sys.intern(worker_id)
+        self.breeder_type = breeder_type = sys.intern(breeder_type)
 
         # Check if metrics pushing is enabled
-        self.enabled = os.getenv("PUSH_METRICS_ENABLED", "true").lower() == "true"
-        self.pushgateway_url = pushgateway_url or os.getenv("PUSH_GATEWAY_URL", "http://pushgateway:9091")
+        self.enabled = _PUSH_ENABLED
+        self.pushgateway_url = pushgateway_url or _DEFAULT_PUSHGW
+        self.push_interval = _DEFAULT_PUSH_INTERVAL if push_interval is None else push_interval
+        self._pusher: Optional[threading.Thread] = None
 
         if not self.enabled:
             logger.info("Prometheus metrics pushing disabled via PUSH_METRICS_ENABLED=false")
+            # Shadow the metric methods with no-ops so disabled clients skip
+            # the enabled check on every call
+            for name in _METRIC_METHODS:
+                setattr(self, name, _noop)
+            self.push = _push_disabled
             return
 
         # Create Prometheus registry and metrics
         self.registry = CollectorRegistry()
         self._init_metrics()
 
+        # Labelled child metrics, bound on first use (see _child)
+        self._children = {}
+        self._worker_labels = {'breeder_id': breeder_id, 'worker_id': worker_id, 'breeder_type': breeder_type}
+
+        # Push Gateway group of this worker; pushes replace only this group
+        self._grouping_key = {'breeder_id': breeder_id, 'worker_id': worker_id}
+
+        # Kept-alive HTTP session reused by every push (see _push_handler)
+        self._session = requests.Session()
+
+        if self.push_interval > 0:
+            self._push_requested = threading.Event()
+            self._stop_pusher = threading.Event()
+            self._pusher = threading.Thread(
+                target=self._push_loop,
+                name=f'metrics-pusher-{worker_id}',
+                daemon=True
+            )
+            self._pusher.start()
+
         logger.debug(f"Initialized {self.__class__.__name__} for {breeder_id}/{worker_id}")
 
     def _init_metrics(self):
@@ -108,7 +170,7 @@ class BreederMetricsClient:
             'godon_breeder_trial_duration_seconds',
             'Trial execution time',
             ['breeder_id', 'worker_id', 'breeder_type'],
-            buckets=[1, 5, 10, 30, 60, 120, 300, 600, 1800],
+            buckets=_TRIAL_DURATION_BUCKETS,
             registry=self.registry
         )
 
@@ -144,21 +206,88 @@ class BreederMetricsClient:
             registry=self.registry
         )
 
+    def _child(self, metric_attr: str, **variant_labels):
+        """
+        Get the labelled child of a metric for this worker.
+
+        The breeder/worker/type labels never change for a client, so each
+        child is resolved through labels() once and reused afterwards.
+
+        Args:
+            metric_attr: Attribute name of the parent metric (e.g. '_trial_count')
+            **variant_labels: Remaining per-call label values (e.g. state='complete')
+        """
+        key = (metric_attr, *variant_labels.values())
+        child = self._children.get(key)
+        if child is None:
+            child = getattr(self, metric_attr).labels(**self._worker_labels, **variant_labels)
+            self._children[key] = child
+        return child
+
     def push(self) -> bool:
         """
         Push all metrics to Push Gateway.
 
+        With a background pusher running, this only flags the metrics for
+        the next periodic push and returns immediately.
+
         Returns:
-            True if push succeeded, False otherwise
+            True if push succeeded (or was scheduled), False otherwise
         """
-        if not self.enabled:
-            return False
+        if self._pusher is not None:
+            self._push_requested.set()
+            return True
+
+        return self._push_now()
 
+    def close(self) -> bool:
+        """
+        Stop the background pusher, send any pending metrics and release
+        the Push Gateway connection.
+
+        Returns:
+            True if nothing was pending or the final push succeeded
+        """
+        pushed = True
+        if self._pusher is not None:
+            self._stop_pusher.set()
+            self._pusher.join()
+            self._pusher = None
+
+            if self._push_requested.is_set():
+                self._push_requested.clear()
+                pushed = self._push_now()
+
+        if self.enabled:
+            self._session.close()
+        return pushed
+
+    def _push_loop(self):
+        """Background loop pushing requested metrics once per push_interval"""
+        while not self._stop_pusher.wait(self.push_interval):
+            if self._push_requested.is_set():
+                self._push_requested.clear()
+                self._push_now()
+
+    def _push_handler(self, url: str, method: str, timeout: Optional[float],
+                      headers: List[Tuple[str, str]], data: bytes) -> Callable[[], None]:
+        """push_to_gateway handler sending over the client's persistent session"""
+        def handle():
+            response = self._session.request(method, url, data=data, headers=dict(headers), timeout=timeout)
+            if response.status_code >= 400:
+                raise IOError(f"error talking to pushgateway: {response.status_code} {response.reason}")
+
+        return handle
+
+    def _push_now(self) -> bool:
+        """Synchronously push all metrics to Push Gateway"""
         try:
             push_to_gateway(
                 self.pushgateway_url,
-                job=f'breeder_{self.breeder_id}',
-                registry=self.registry
+                job=_PUSH_JOB,
+                grouping_key=self._grouping_key,
+                registry=self.registry,
+                handler=self._push_handler
             )
             logger.debug(f"Pushed metrics to {self.pushgateway_url}")
             return True
@@ -169,37 +298,13 @@ class BreederMetricsClient:
     # Status methods
     def mark_running(self):
         """Mark worker as running (call at start of run())"""
-        if not self.enabled:
-            return
-        self._worker_status.labels(
-            breeder_id=self.breeder_id,
-            worker_id=self.worker_id,
-            breeder_type=self.breeder_type,
-            status='running'
-        ).set(1)
-        self._worker_status.labels(
-            breeder_id=self.breeder_id,
-            worker_id=self.worker_id,
-            breeder_type=self.breeder_type,
-            status='stopped'
-        ).set(0)
+        self._child('_worker_status', status='running').set(1)
+        self._child('_worker_status', status='stopped').set(0)
 
     def mark_stopped(self):
         """Mark worker as stopped (call at end of run())"""
-        if not self.enabled:
-            return
-        self._worker_status.labels(
-            breeder_id=self.breeder_id,
-            worker_id=self.worker_id,
-            breeder_type=self.breeder_type,
-            status='running'
-        ).set(0)
-        self._worker_status.labels(
-            breeder_id=self.breeder_id,
-            worker_id=self.worker_id,
-            breeder_type=self.breeder_type,
-            status='stopped'
-        ).set(1)
+        self._child('_worker_status', status='running').set(0)
+        self._child('_worker_status', status='stopped').set(1)
 
     # Trial methods
     def inc_trial(self, state: str, value: Optional[float] = None):
@@ -210,52 +315,22 @@ class BreederMetricsClient:
             state: Trial state ('complete', 'failed', 'running', 'pruned')
             value: Trial value (optional, updates best/last value gauges)
         """
-        if not self.enabled:
-            return
-
-        self._trial_count.labels(
-            breeder_id=self.breeder_id,
-            worker_id=self.worker_id,
-            breeder_type=self.breeder_type,
-            state=state
-        ).inc()
+        self._child('_trial_count', state=state).inc()
 
         if value is not None:
-            self._last_trial_value.labels(
-                breeder_id=self.breeder_id,
-                worker_id=self.worker_id,
-                breeder_type=self.breeder_type
-            ).set(value)
+            self._child('_last_trial_value').set(value)
 
     def set_best_value(self, value: float):
         """Set best objective value"""
-        if not self.enabled:
-            return
-        self._best_value.labels(
-            breeder_id=self.breeder_id,
-            worker_id=self.worker_id,
-            breeder_type=self.breeder_type
-        ).set(value)
+        self._child('_best_value').set(value)
 
     def set_total_trials(self, count: int):
         """Set total number of trials in study"""
-        if not self.enabled:
-            return
-        self._total_trials.labels(
-            breeder_id=self.breeder_id,
-            worker_id=self.worker_id,
-            breeder_type=self.breeder_type
-        ).set(count)
+        self._child('_total_trials').set(count)
 
     def observe_trial_duration(self, duration_seconds: float):
         """Record trial execution duration"""
-        if not self.enabled:
-            return
-        self._trial_duration.labels(
-            breeder_id=self.breeder_id,
-            worker_id=self.worker_id,
-            breeder_type=self.breeder_type
-        ).observe(duration_seconds)
+        self._child('_trial_duration').observe(duration_seconds)
 
     # Effectuation methods
     def inc_effectuation(self, status: str):
@@ -265,26 +340,12 @@ class BreederMetricsClient:
         Args:
             status: 'success' or 'failure'
         """
-        if not self.enabled:
-            return
-        self._effectuation_count.labels(
-            breeder_id=self.breeder_id,
-            worker_id=self.worker_id,
-            breeder_type=self.breeder_type,
-            status=status
-        ).inc()
+        self._child('_effectuation_count', status=status).inc()
 
     # Guardrail methods
     def inc_guardrail_violation(self, guardrail_name: str):
         """Increment guardrail violation counter"""
-        if not self.enabled:
-            return
-        self._guardrail_violations.labels(
-            breeder_id=self.breeder_id,
-            worker_id=self.worker_id,
-            breeder_type=self.breeder_type,
-            guardrail_name=guardrail_name
-        ).inc()
+        self._child('_guardrail_violations', guardrail_name=guardrail_name).inc()
 
     # Rollback methods
     def inc_rollback(self, status: str):
@@ -294,14 +355,7 @@ class BreederMetricsClient:
         Args:
             status: 'success' or 'failed'
         """
-        if not self.enabled:
-            return
-        self._rollback_count.labels(
-            breeder_id=self.breeder_id,
-            worker_id=self.worker_id,
-            breeder_type=self.breeder_type,
-            status=status
-        ).inc()
+        self._child('_rollback_count', status=status).inc()
 
     # Cooperation methods
     def inc_trial_shared(self, strategy: str):
@@ -311,11 +365,4 @@ class BreederMetricsClient:
         Args:
             strategy: Sharing strategy ('probabilistic', 'best', 'worst', 'extremes')
         """
-        if not self.enabled:
-            return
-        self._trials_shared.labels(
-            breeder_id=self.breeder_id,
-            worker_id=self.worker_id,
-            breeder_type=self.breeder_type,
-            strategy=strategy
-        ).inc()
+        self._child('_trials_shared', strategy=strategy).inc()
@@ -18,16 +18,21 @@
 #
 
 import os
+import re
+import sys
+import json
+import queue
+import threading
 import optuna
 import logging
 import wmill
 import random
-import hashlib
+import zlib
+import bisect
 import datetime
-import dateutil.parser
 import time
 import psycopg2
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List, Tuple
 from optuna.trial import TrialState
 from optuna.samplers import TPESampler, NSGAIISampler, NSGAIIISampler, RandomSampler, QMCSampler
 from optuna.samplers.nsgaii import (
@@ -38,12 +43,231 @@ from optuna.samplers.nsgaii import (
     SBXCrossover,
     VSBXCrossover
 )
-from scipy.stats import percentileofscore
 from f.breeder.linux_performance.breeder_metrics_client import BreederMetricsClient
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+callback_logger = logging.getLogger('communication-callback')
+callback_logger.setLevel(logging.DEBUG)
+
+# Queue sentinel telling the trial sharer thread to flush and exit
+_STOP_SHARING = object()
+
+# Progress (Windmill state and metrics push) is reported every this many
+# trials, or once this many seconds have passed, whichever comes first
+_PROGRESS_EVERY_TRIALS = 5
+_PROGRESS_INTERVAL = 60.0
+
+# Rollback state updates retried once after losing a version conflict
+_ROLLBACK_UPDATE_ATTEMPTS = 2
+
+# Completion time budget, e.g. "7d", "24h", "60m"
+_TIME_BUDGET_RE = re.compile(r'(\d+)([dhm])')
+_TIME_UNIT_SECONDS = {'d': 86400, 'h': 3600, 'm': 60}
+
+
+def _rdb_engine_kwargs(application_name: str) -> Dict[str, Any]:
+    """
+    SQLAlchemy engine settings for the Optuna RDB storage.
+
+    Bounds the connections each worker holds against the archive DB,
+    validates pooled connections before reuse and recycles them before
+    server-side idle timeouts kick in.
+    """
+    return {
+        'pool_size': 4,
+        'max_overflow': 2,
+        'pool_pre_ping': True,
+        'pool_recycle': 300,
+        'connect_args': {
+            'connect_timeout': 5,
+            'application_name': application_name
+        }
+    }
+
+
+# Samplers handed out to parallel workers for algorithm diversity, in order
+_DIVERSITY_SAMPLERS = ('tpe', 'nsga2', 'random', 'nsga3', 'qmc')
+
+# Sampler parameter profiles with confidence levels
+# HIGH = Well-researched, documented defaults and variations
+# MEDIUM = Educated guesses from GA/BO literature, less certain
+# LOW = Uncertain, needs empirical validation
+# Parameter ranges are based on Optuna documentation and common practices.
+_SAMPLER_PROFILES = {
+    'tpe': {
+        # Valid (multivariate, group) combinations - Optuna requires multivariate=True when group=True
+        'multivariate_group': ((True, True), (True, False), (False, False)),  # HIGH
+        'constant_liar': (True, False),  # HIGH - Proven for parallel optimization
+        'n_startup_trials': (5, 10, 20)  # MEDIUM - Educated guess, needs validation
+    },
+    'nsga2': {
+        'population_size': (30, 50, 75, 100, 125, 150),  # Safe min=30, max=150 with 6 diverse steps
+        'mutation_prob': (0.05, 0.1, 0.15),  # LOW - Educated guess from GA literature
+        'crossover_prob': (0.8, 0.9, 0.95),  # MEDIUM - Common GA values, less certain for Optuna
+        'crossover': ('uniform', 'UNDX', 'SPX', 'BLXAlpha', 'SBX', 'VSBX')  # All Optuna NSGA-II crossovers
+    },
+    'nsga3': {
+        'population_size': (50, 100)  # HIGH - Safe variations on default
+    },
+    'random': {
+        'seed': (None,)  # HIGH - Placeholder for future seed diversity
+    },
+    'qmc': {
+        'seed': (None,)  # HIGH - Placeholder for future seed diversity
+    }
+}
+
+
+# NSGA-II crossover constructors by profile name
+_CROSSOVER_CTORS = {
+    'uniform': UniformCrossover,
+    'UNDX': UNDXCrossover,
+    'SPX': SPXCrossover,
+    'BLXAlpha': BLXAlphaCrossover,
+    'SBX': SBXCrossover,
+    'VSBX': VSBXCrossover
+}
+
+# NOTE: UNDX and SPX require population_size >= n_parents (3)
+_CROSSOVER_MIN_POPULATION = {'UNDX': 3, 'SPX': 3}
+
+
+def _make_tpe(rng: random.Random) -> optuna.samplers.BaseSampler:
+    profile = _SAMPLER_PROFILES['tpe']
+    multivariate, group = rng.choice(profile['multivariate_group'])
+
+    config = {
+        'multivariate': multivariate,
+        'group': group,
+        'constant_liar': rng.choice(profile['constant_liar']),
+        'n_startup_trials': rng.choice(profile['n_startup_trials'])
+    }
+    logger.info("Created TPE sampler with config: %s", config)
+    return TPESampler(**config)
+
+
+def _make_nsga2(rng: random.Random) -> optuna.samplers.BaseSampler:
+    profile = _SAMPLER_PROFILES['nsga2']
+    population_size = rng.choice(profile['population_size'])
+    crossover_name = rng.choice(profile['crossover'])
+
+    # Instantiate crossover objects (not strings)
+    crossover_ctor = _CROSSOVER_CTORS.get(crossover_name)
+    if crossover_ctor is None:
+        logger.warning("Unknown crossover '%s', falling back to UniformCrossover", crossover_name)
+        crossover_ctor = UniformCrossover
+    population_size = max(population_size, _CROSSOVER_MIN_POPULATION.get(crossover_name, 0))
+    crossover_obj = crossover_ctor()
+
+    config = {
+        'population_size': population_size,
+        'mutation_prob': rng.choice(profile['mutation_prob']),
+        'crossover_prob': rng.choice(profile['crossover_prob']),
+        'crossover': crossover_obj
+    }
+    logger.info("Created NSGAII sampler with crossover=%s, config: %s", crossover_name, config)
+    return NSGAIISampler(**config)
+
+
+def _make_nsga3(rng: random.Random) -> optuna.samplers.BaseSampler:
+    population_size = rng.choice(_SAMPLER_PROFILES['nsga3']['population_size'])
+    config = {'population_size': population_size}
+    logger.info("Created NSGAIII sampler with config: %s", config)
+    return NSGAIIISampler(**config)
+
+
+def _make_random(rng: random.Random) -> optuna.samplers.BaseSampler:
+    seed = rng.choice(_SAMPLER_PROFILES['random']['seed'])
+    config = {'seed': seed} if seed is not None else {}
+    logger.info("Created Random sampler with config: %s", config)
+    return RandomSampler(**config)
+
+
+def _make_qmc(rng: random.Random) -> optuna.samplers.BaseSampler:
+    seed = rng.choice(_SAMPLER_PROFILES['qmc']['seed'])
+    config = {'seed': seed} if seed is not None else {}
+    logger.info("Created QMC sampler with config: %s", config)
+    return QMCSampler(**config)
+
+
+_SAMPLER_FACTORIES = {
+    'tpe': _make_tpe,
+    'nsga2': _make_nsga2,
+    'nsga3': _make_nsga3,
+    'random': _make_random,
+    'qmc': _make_qmc
+}
+
+
+def _bind_suggest(param_name: str, constraints_list: List[Dict[str, Any]],
+                  category: str) -> Callable[[optuna.Trial], Any]:
+    """
+    Resolve a parameter's constraints into the Optuna suggest call for it.
+
+    v0.3: Supports list of constraints with multiple disjoint ranges or categorical values.
+
+    Args:
+        param_name: Parameter name
+        constraints_list: List of constraint objects (ranges or categorical)
+        category: Parameter category (for error messages)
+
+    Returns:
+        Function taking an Optuna trial and returning the suggested value (int, float, or str)
+
+    Raises:
+        ValueError: If constraint structure is invalid
+    """
+    if not isinstance(constraints_list, list) or len(constraints_list) == 0:
+        raise ValueError(f"{category}.{param_name}: constraints must be a non-empty list")
+
+    # Check constraint type from first constraint
+    first_constraint = constraints_list[0]
+
+    # Categorical parameter (has 'values')
+    if 'values' in first_constraint:
+        # For categorical, use first constraint's values
+        # (multiple categorical constraints don't make sense)
+        values = first_constraint['values']
+        return lambda trial: trial.suggest_categorical(param_name, values)
+
+    # Integer/float range (has 'step', 'lower', 'upper')
+    elif 'step' in first_constraint and 'lower' in first_constraint and 'upper' in first_constraint:
+        # Multiple disjoint ranges - use first range for suggestion
+        # Note: Optuna doesn't support disjoint ranges directly, so we use the first range
+        # The sharding logic in controller distributes different ranges to different workers
+        constraint = first_constraint
+        lower = constraint['lower']
+        upper = constraint['upper']
+        step = constraint['step']
+
+        # Determine if integer or float based on step type
+        if isinstance(step, int) and isinstance(lower, int) and isinstance(upper, int):
+            return lambda trial: trial.suggest_int(param_name, lower, upper, step=step)
+        else:
+            return lambda trial: trial.suggest_float(param_name, lower, upper, step=step)
+
+    else:
+        raise ValueError(
+            f"{category}.{param_name}: constraint must have either 'values' (categorical) "
+            f"or 'step/lower/upper' (numeric range)"
+        )
+
+
+def _noop(*args, **kwargs):
+    return None
+
+
+def _failing_suggest(error: ValueError) -> Callable[[optuna.Trial], Any]:
+    """Suggest call for a parameter with invalid constraints, failing each trial as before"""
+    message = str(error)
+
+    def suggest(trial: optuna.Trial) -> Any:
+        raise ValueError(message)
+
+    return suggest
+
 
 class CommunicationCallback:
     """Shares successful trials with cooperating breeders for metaheuristic learning
@@ -54,84 +278,302 @@ class CommunicationCallback:
     - worst: Share only bottom-performing trials (bottom percentile)  
     - extremes: Share both top and bottom-performing trials
     """
-    
+
+    __slots__ = ('storage', 'share_strategy', 'com_probability', 'top_percentile',
+                 'bottom_percentile', 'min_trials_for_filtering', 'share_within_breeder',
+                 'logger', '_storage', '_studies', '_studies_ts', '_refresh_interval', '_random',
+                 '_queue', '_sharer', '_flush_every', '_flush_interval', '_peer_names',
+                 '_values', '_values_scanned', '_values_ahead', '_always_share',
+                 '_never_share', '_strategy_fn')
+
+    # Share decision method per strategy (see _should_share_trial)
+    _STRATEGY_METHODS = {
+        'probabilistic': '_share_probabilistic',
+        'best': '_share_best',
+        'worst': '_share_worst',
+        'extremes': '_share_extremes'
+    }
+
     def __init__(self, storage: str, share_strategy: str = "probabilistic", 
                  probability: float = 0.8, top_percentile: float = 0.2,
                  bottom_percentile: float = 0.2, min_trials_for_filtering: int = 10,
-                 share_within_breeder: bool = True):
+                 share_within_breeder: bool = True, refresh_interval: float = 30.0,
+                 flush_every: int = 8, flush_interval: float = 60.0, queue_size: int = 128,
+                 peer_names: Optional[Tuple[str, ...]] = None):
         self.storage = storage
-        self.share_strategy = share_strategy
+        self.share_strategy = sys.intern(share_strategy)
         self.com_probability = probability
         self.top_percentile = top_percentile
         self.bottom_percentile = bottom_percentile
         self.min_trials_for_filtering = min_trials_for_filtering
         self.share_within_breeder = share_within_breeder
-        self.logger = logging.getLogger('communication-callback')
-        self.logger.setLevel(logging.DEBUG)
-    
-    def _share_trial(self, study: optuna.study.Study, trial: optuna.trial.FrozenTrial) -> None:
-        """Share completed trial with all cooperating studies in database"""
+        self.logger = callback_logger
+
+        # Storage object shared by discovery and all loaded studies (see _get_storage)
+        self._storage: Optional[optuna.storages.BaseStorage] = None
+
+        # Loaded cooperating studies, refreshed every refresh_interval seconds
+        self._studies: Dict[str, optuna.study.Study] = {}
+        self._studies_ts: Optional[float] = None
+        self._refresh_interval = refresh_interval
+        # Known cooperating study names; when set, the storage is not listed
+        self._peer_names = peer_names
+
+        # Sorted first-objective values of the study's completed trials, kept
+        # up to date incrementally for the quality-based strategies: trials
+        # below _values_scanned are all counted, _values_ahead holds trials
+        # counted past one that was still running (see _update_values)
+        self._values: List[float] = []
+        self._values_scanned = 0
+        self._values_ahead: set = set()
+
+        # Private generator so probabilistic gating neither contends on nor
+        # perturbs the module-level random state; bound once for the hot path
+        self._random = random.Random().random
+        # Probabilistic gating decided once for the certain cases
+        self._always_share = probability >= 1.0
+        self._never_share = probability <= 0.0
+
+        # Share decision bound once for the configured strategy
+        method_name = self._STRATEGY_METHODS.get(self.share_strategy)
+        if method_name is None:
+            self.logger.warning("Unknown strategy '%s', defaulting to share", self.share_strategy)
+            self._strategy_fn = self._share_all
+        else:
+            self._strategy_fn = getattr(self, method_name)
+
+        # Trials selected for sharing are handed to a background thread that
+        # sends them in one batch once flush_every trials are pending or the
+        # oldest has waited flush_interval seconds (see _share_loop)
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._sharer: Optional[threading.Thread] = None
+        self._flush_every = flush_every
+        self._flush_interval = flush_interval
+
+    def _get_storage(self) -> optuna.storages.BaseStorage:
+        """Get the storage object, creating a single RDBStorage from the URL on first use
+
+        Passing the URL to Optuna instead would build a new SQLAlchemy engine
+        (and connection pool) for every listing and every loaded study.
+        """
+        if self._storage is None:
+            if isinstance(self.storage, str):
+                self._storage = optuna.storages.RDBStorage(url=self.storage)
+            else:
+                self._storage = self.storage
+        return self._storage
+
+    def _cooperating_studies(self, study: optuna.study.Study) -> Dict[str, optuna.study.Study]:
+        """Return cooperating study handles, discovering newly created studies periodically"""
+        now = time.monotonic()
+        if self._studies_ts is not None and now - self._studies_ts < self._refresh_interval:
+            return self._studies
+
+        if self._peer_names is not None:
+            study_names = self._peer_names
+        else:
+            try:
+                study_names = optuna.get_all_study_names(storage=self._get_storage())
+            except Exception as e:
+                # Keep sharing with the known studies, retry discovery next trial
+                self.logger.warning("Failed to list cooperating studies: %s", e)
+                self._studies_ts = None
+                return self._studies
+
+            # Skip sharing within same breeder if disabled
+            if not self.share_within_breeder:
+                breeder_prefix = study.study_name.split('_', 1)[0]
+                study_names = [name for name in study_names if not name.startswith(breeder_prefix)]
+
+        for study_name in study_names:
+            if study_name == study.study_name or study_name in self._studies:
+                continue
+
+            try:
+                self._studies[study_name] = optuna.load_study(study_name=study_name, storage=self._get_storage())
+            except Exception as e:
+                self.logger.warning("Failed to load cooperating study %s: %s", study_name, e)
+
+        self._studies_ts = now
+        return self._studies
+
+    def _share_trials(self, study: optuna.study.Study, trials: List[optuna.trial.FrozenTrial]) -> None:
+        """Share completed trials with all cooperating studies in database"""
         try:
-            study_names = study.get_all_study_names(storage=self.storage)
-            
-            for study_name in study_names:
-                if study_name != study.study_name:
-                    # Skip sharing within same breeder if disabled
-                    if not self.share_within_breeder:
-                        breeder_prefix = study.study_name.split('_')[0]
-                        if study_name.startswith(breeder_prefix):
-                            continue
-                    
-                    try:
-                        cooperating_study = optuna.load_study(study_name=study_name, storage=self.storage)
-                        cooperating_study.add_trial(trial)
-                        self.logger.info(f"Shared trial {trial.number} with {study_name}")
-                    except Exception as e:
-                        self.logger.warning(f"Failed to share with {study_name}: {e}")
-                        
+            # Validate once per batch instead of once per cooperating study
+            # as Study.add_trials would, then create the trials directly;
+            # an invalid trial is skipped on its own
+            valid_trials = []
+            for trial in trials:
+                try:
+                    trial._validate()
+                except ValueError as e:
+                    self.logger.warning("Not sharing trial %s: %s", trial.number, e)
+                    continue
+                valid_trials.append(trial)
+
+            if not valid_trials:
+                return
+
+            for study_name, cooperating_study in list(self._cooperating_studies(study).items()):
+                try:
+                    # Objective count checked per trial as Study.add_trial does;
+                    # trials without values (e.g. FAIL) fit every study
+                    n_objectives = len(cooperating_study.directions)
+                    shared = [t for t in valid_trials if t.values is None or len(t.values) == n_objectives]
+                    if len(shared) < len(valid_trials):
+                        self.logger.warning("Not sharing trials %s with %s: study has %s objectives",
+                                            [t.number for t in valid_trials if t not in shared],
+                                            study_name, n_objectives)
+
+                    create_trial = cooperating_study._storage.create_new_trial
+                    study_id = cooperating_study._study_id
+                    for trial in shared:
+                        create_trial(study_id, template_trial=trial)
+                    if shared:
+                        self.logger.info("Shared trials %s with %s", [t.number for t in shared], study_name)
+                except Exception as e:
+                    self.logger.warning("Failed to share with %s: %s", study_name, e)
+                    # Drop the handle (the study may have been deleted) and
+                    # rediscover studies on the next share
+                    self._studies.pop(study_name, None)
+                    self._studies_ts = None
+
         except Exception as e:
-            self.logger.error(f"Communication failed: {e}")
+            self.logger.error("Communication failed: %s", e)
     
     def _should_share_trial(self, study: optuna.study.Study, trial: optuna.trial.FrozenTrial) -> bool:
         """Determine if trial should be shared based on strategy"""
-        if self.share_strategy == "probabilistic":
-            return random.random() < self.com_probability
-        
-        # For quality-based strategies, need enough trials for meaningful filtering
-        completed_trials = [t for t in study.trials if t.state == TrialState.COMPLETE and t.values]
-        if len(completed_trials) < self.min_trials_for_filtering:
-            self.logger.debug(f"Insufficient trials ({len(completed_trials)}) for quality filtering, sharing all")
+        return self._strategy_fn(study, trial)
+
+    def _share_probabilistic(self, study: optuna.study.Study, trial: optuna.trial.FrozenTrial) -> bool:
+        # Certain outcomes need no draw
+        if self._always_share:
             return True
-        
+        return not self._never_share and self._random() < self.com_probability
+
+    def _share_best(self, study: optuna.study.Study, trial: optuna.trial.FrozenTrial) -> bool:
+        percentile = self._trial_percentile(study, trial)
+        return percentile is None or percentile >= (100 - self.top_percentile * 100)
+
+    def _share_worst(self, study: optuna.study.Study, trial: optuna.trial.FrozenTrial) -> bool:
+        percentile = self._trial_percentile(study, trial)
+        return percentile is None or percentile <= self.bottom_percentile * 100
+
+    def _share_extremes(self, study: optuna.study.Study, trial: optuna.trial.FrozenTrial) -> bool:
+        percentile = self._trial_percentile(study, trial)
+        if percentile is None:
+            return True
+        top_threshold = 100 - self.top_percentile * 100
+        bottom_threshold = self.bottom_percentile * 100
+        return percentile >= top_threshold or percentile <= bottom_threshold
+
+    def _share_all(self, study: optuna.study.Study, trial: optuna.trial.FrozenTrial) -> bool:
+        return True
+
+    def _trial_percentile(self, study: optuna.study.Study, trial: optuna.trial.FrozenTrial) -> Optional[float]:
+        """Percentile of the trial among completed trials, None if too few for quality filtering"""
+        # For quality-based strategies, need enough trials for meaningful filtering
+        self._update_values(study)
+        if len(self._values) < self.min_trials_for_filtering:
+            self.logger.debug("Insufficient trials (%s) for quality filtering, sharing all", len(self._values))
+            return None
+
         # Get trial value (use first objective for multi-objective)
         trial_value = trial.values[0] if trial.values else float('inf')
-        all_values = [t.values[0] for t in completed_trials if t.values]
-        
-        if self.share_strategy == "best":
-            percentile = percentileofscore(all_values, trial_value)
-            return percentile >= (100 - self.top_percentile * 100)
-        
-        elif self.share_strategy == "worst":
-            percentile = percentileofscore(all_values, trial_value)
-            return percentile <= self.bottom_percentile * 100
-        
-        elif self.share_strategy == "extremes":
-            percentile = percentileofscore(all_values, trial_value)
-            top_threshold = 100 - self.top_percentile * 100
-            bottom_threshold = self.bottom_percentile * 100
-            return percentile >= top_threshold or percentile <= bottom_threshold
-        
-        else:
-            self.logger.warning(f"Unknown strategy '{self.share_strategy}', defaulting to share")
-            return True
-    
+        return self._percentile_of(trial_value)
+
+    def _update_values(self, study: optuna.study.Study) -> None:
+        """Add values of trials finished since the last call to the sorted values"""
+        values = self._values
+        ahead = self._values_ahead
+        blocked = False  # an earlier trial is still running
+
+        for t in study.get_trials(deepcopy=False)[self._values_scanned:]:
+            if not t.state.is_finished():
+                blocked = True
+                continue
+            if t.number not in ahead:
+                if t.state == TrialState.COMPLETE and t.values:
+                    bisect.insort(values, t.values[0])
+                if blocked:
+                    ahead.add(t.number)
+            elif not blocked:
+                ahead.discard(t.number)
+            if not blocked:
+                self._values_scanned = t.number + 1
+
+    def _percentile_of(self, value: float) -> float:
+        """Percentile rank of value among the completed values
+
+        Same result as scipy.stats.percentileofscore(values, value, kind='rank').
+        """
+        values = self._values
+        left = bisect.bisect_left(values, value)
+        right = bisect.bisect_right(values, value)
+        return (left + right + (right > left)) * 50.0 / len(values)
+
+    def _share_loop(self) -> None:
+        """Background loop batching queued trials into _share_trials calls"""
+        pending: List[optuna.trial.FrozenTrial] = []
+        source_study = None
+        deadline = 0.0
+
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if pending else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None  # oldest pending trial reached flush_interval
+
+            if item is _STOP_SHARING:
+                if pending:
+                    self._share_trials(source_study, pending)
+                return
+
+            if item is not None:
+                source_study, trial = item
+                if not pending:
+                    deadline = time.monotonic() + self._flush_interval
+                pending.append(trial)
+
+            if pending and (item is None or len(pending) >= self._flush_every or time.monotonic() >= deadline):
+                self._share_trials(source_study, pending)
+                pending = []
+
+    def _enqueue(self, item) -> None:
+        """Queue a trial for sharing, dropping the oldest queued trial when full"""
+        if self._sharer is None:
+            self._sharer = threading.Thread(target=self._share_loop, name='trial-sharer', daemon=True)
+            self._sharer.start()
+
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    _, dropped = self._queue.get_nowait()
+                    self.logger.warning("Share queue full, dropping trial %s", dropped.number)
+                except queue.Empty:
+                    pass
+
+    def flush(self) -> None:
+        """Share all queued trials and stop the background sharer (call before the worker exits)"""
+        if self._sharer is None:
+            return
+
+        self._queue.put(_STOP_SHARING)
+        self._sharer.join()
+        self._sharer = None
+
     def __call__(self, study: optuna.study.Study, trial: optuna.trial.FrozenTrial) -> None:
         """Trial sharing based on configured strategy"""
         if self._should_share_trial(study, trial):
-            self.logger.debug(f"Sharing trial {trial.number} (strategy: {self.share_strategy})")
-            self._share_trial(study, trial)
+            self.logger.debug("Sharing trial %d (strategy: %s)", trial.number, self.share_strategy)
+            self._enqueue((study, trial))
         else:
-            self.logger.debug(f"Skipping trial sharing for {trial.number} (strategy: {self.share_strategy})")
+            self.logger.debug("Skipping trial sharing for %d (strategy: %s)", trial.number, self.share_strategy)
 
 
 class BreederWorker:
@@ -151,12 +593,50 @@ class BreederWorker:
         creation_ts_str = config.get('creation_ts')
         if not creation_ts_str:
             raise ValueError("Required field 'creation_ts' missing from config")
-        self.start_time = dateutil.parser.parse(creation_ts_str)
+        # Controller writes ISO 8601 with a 'Z' suffix, which fromisoformat only accepts from Python 3.11
+        self.start_time = datetime.datetime.fromisoformat(creation_ts_str.replace('Z', '+00:00'))
+        self._budget_deadline = self._parse_time_budget()
+
+        # Completion criteria are fixed for the worker's lifetime
+        completion_criteria = config.get('run', {}).get('completion_criteria', {})
+        self._min_iterations = completion_criteria.get('iterations', {}).get('min', 10)
+        self._max_iterations = completion_criteria.get('iterations', {}).get('max', 1000)
+        self._quality_achieved = completion_criteria.get('quality_achieved', False)
+
+        # Objective layout is fixed for the worker's lifetime
+        self._objectives = tuple(config.get('objectives', []))
+        self._obj_names = tuple(obj.get('name') for obj in self._objectives)
+        self._obj_dirs = tuple(obj.get('direction') for obj in self._objectives)
+        # (maximize, threshold) per objective, None unless every objective has one
+        self._quality_thresholds = self._build_quality_thresholds()
+        # Metrics reported for a trial whose effectuation produced none
+        self._penalty = dict.fromkeys(self._obj_names, float('inf'))
+
+        # Archive DB location and the storage built on it (see _get_storage)
+        self._db_url = self._get_db_url()
+        self._storage: Optional[optuna.storages.RDBStorage] = None
+
+        # Parameters to suggest, flattened once from the settings config
+        self._param_plan = self._build_param_plan()
+        # Guardrails with a usable hard limit, checked after every trial
+        self._guardrail_limits = self._build_guardrail_limits()
+
+        # Private generator for sampler profile draws, seeded per worker and
+        # run so a restarted worker comes back with the same sampler config
+        self._rng = random.Random(zlib.crc32(f"{self.worker_id}:{config.get('run_id', 0)}".encode()))
 
         # Assign sampler to this worker for algorithm diversity
         self.sampler_type = self._assign_sampler()
 
         self.study = self._load_or_create_study()
+
+        # Best value tracked locally for single-objective studies so that
+        # completed trials need not recompute it from storage; trials shared
+        # in by cooperating workers are picked up by _refresh_best_value
+        self._maximize = self._obj_dirs[:1] == ('maximize',)
+        self._best_value: Optional[float] = None
+        self._improves_best(self._study_best_value())
+
         self.communication_callback = self._setup_communication()
 
         # Rollback state tracking
@@ -170,17 +650,34 @@ class BreederWorker:
             self.target = targets[self.target_id]
         else:
             self.target = targets[0] if targets else {}
-            logger.warning(f"Invalid target_id {self.target_id}, using first target")
+            logger.warning("Invalid target_id %s, using first target", self.target_id)
 
         self.rollback_config = self.target.get('rollback', {})
         self.rollback_enabled = self.rollback_config.get('enabled', False)
 
+        # Rollback strategy settings are fixed for the worker's lifetime
+        strategy_name = self.rollback_config.get('strategy', 'standard')
+        self._rollback_strategy = self.config.get('rollback_strategies', {}).get(strategy_name, {})
+        self._rollback_threshold = self._rollback_strategy.get('consecutive_failures', 3)
+
+        # In-memory copy of this target's rollback state, loaded from the
+        # study on first use; dirty while it holds changes not yet written
+        self._rollback_state: Optional[Dict[str, Any]] = None
+        self._rollback_dirty = False
+
         if self.rollback_enabled:
-            logger.info(f"Rollback enabled for target {self.target_id}")
-            logger.info(f"Rollback strategy: {self.rollback_config.get('strategy', 'unknown')}")
+            logger.info("Rollback enabled for target %s", self.target_id)
+            logger.info("Rollback strategy: %s", self.rollback_config.get('strategy', 'unknown'))
             # Initialize rollback state in study if not exists
             self._init_rollback_state()
+        else:
+            # Shadow the per-trial rollback bookkeeping with no-ops so the
+            # trial loop skips it entirely
+            self._handle_successful_trial = _noop
+            self._handle_guardrail_violation = _noop
 
+        # Last state written to Windmill (see _update_state)
+        self._last_state: Optional[Dict[str, Any]] = None
         self._update_state()
 
         # Initialize metrics client
@@ -200,123 +697,27 @@ class BreederWorker:
         
         # Automatically enable algorithm diversity for parallel workers
         # Only use as many samplers as we have workers
-        all_samplers = ['tpe', 'nsga2', 'random', 'nsga3', 'qmc']
-        num_samplers = min(parallel_workers, len(all_samplers))
-        available_samplers = all_samplers[:num_samplers]
+        available_samplers = _DIVERSITY_SAMPLERS[:parallel_workers]
         
         # Assign sampler based on worker_id hash for consistent assignment
-        worker_hash = int(hashlib.md5(self.worker_id.encode()).hexdigest(), 16)
-        sampler_index = worker_hash % len(available_samplers)
+        # (crc32 is stable across processes, unlike the salted built-in hash)
+        sampler_index = zlib.crc32(self.worker_id.encode()) % len(available_samplers)
         assigned_sampler = available_samplers[sampler_index]
         
-        logger.info(f"Algorithm diversity auto-enabled ({len(available_samplers)} samplers for {parallel_workers} workers): Worker {self.worker_id} assigned '{assigned_sampler}' sampler")
+        logger.info("Algorithm diversity auto-enabled (%s samplers for %s workers): Worker %s assigned '%s' sampler", len(available_samplers), parallel_workers, self.worker_id, assigned_sampler)
         return assigned_sampler
     
     def _create_sampler(self, sampler_type: str) -> optuna.samplers.BaseSampler:
         """Create Optuna sampler instance with randomized parameter selection from known-good profiles
         
         NOTE: This is for algorithm diversity + future hyperheuristic optimization.
-        Parameter ranges are based on Optuna documentation and common practices.
-        Some ranges are more researched than others - marked with confidence levels below.
+        Profiles and their confidence levels are listed in _SAMPLER_PROFILES.
         """
-        
-        # Define parameter profiles with confidence levels
-        # HIGH = Well-researched, documented defaults and variations
-        # MEDIUM = Educated guesses from GA/BO literature, less certain
-        # LOW = Uncertain, needs empirical validation
-        sampler_profiles = {
-            'tpe': {
-                # Valid (multivariate, group) combinations - Optuna requires multivariate=True when group=True
-                'multivariate_group': [(True, True), (True, False), (False, False)],  # HIGH
-                'constant_liar': [True, False],  # HIGH - Proven for parallel optimization
-                'n_startup_trials': [5, 10, 20]  # MEDIUM - Educated guess, needs validation
-            },
-            'nsga2': {
-                'population_size': [30, 50, 75, 100, 125, 150],  # Safe min=30, max=150 with 6 diverse steps
-                'mutation_prob': [0.05, 0.1, 0.15],  # LOW - Educated guess from GA literature
-                'crossover_prob': [0.8, 0.9, 0.95],  # MEDIUM - Common GA values, less certain for Optuna
-                'crossover': ['uniform', 'UNDX', 'SPX', 'BLXAlpha', 'SBX', 'VSBX']  # All Optuna NSGA-II crossovers
-            },
-            'nsga3': {
-                'population_size': [50, 100]  # HIGH - Safe variations on default
-            },
-            'random': {
-                'seed': [None]  # HIGH - Placeholder for future seed diversity
-            },
-            'qmc': {
-                'seed': [None]  # HIGH - Placeholder for future seed diversity
-            }
-        }
-        
-        if sampler_type == 'tpe':
-            profile = sampler_profiles['tpe']
-            multivariate, group = random.choice(profile['multivariate_group'])
-
-            config = {
-                'multivariate': multivariate,
-                'group': group,
-                'constant_liar': random.choice(profile['constant_liar']),
-                'n_startup_trials': random.choice(profile['n_startup_trials'])
-            }
-            logger.info(f"Created TPE sampler with config: {config}")
-            return TPESampler(**config)
-        
-        elif sampler_type == 'nsga2':
-            profile = sampler_profiles['nsga2']
-            population_size = random.choice(profile['population_size'])
-            crossover_name = random.choice(profile['crossover'])
-
-            # Instantiate crossover objects (not strings)
-            # NOTE: UNDX and SPX require population_size >= n_parents (3)
-            if crossover_name == 'uniform':
-                crossover_obj = UniformCrossover()
-            elif crossover_name == 'UNDX':
-                population_size = max(population_size, 3)  # UNDX needs 3+ parents
-                crossover_obj = UNDXCrossover()
-            elif crossover_name == 'SPX':
-                population_size = max(population_size, 3)  # SPX needs 3+ parents
-                crossover_obj = SPXCrossover()
-            elif crossover_name == 'BLXAlpha':
-                crossover_obj = BLXAlphaCrossover()
-            elif crossover_name == 'SBX':
-                crossover_obj = SBXCrossover()
-            elif crossover_name == 'VSBX':
-                crossover_obj = VSBXCrossover()
-            else:
-                logger.warning(f"Unknown crossover '{crossover_name}', falling back to UniformCrossover")
-                crossover_obj = UniformCrossover()
-
-            config = {
-                'population_size': population_size,
-                'mutation_prob': random.choice(profile['mutation_prob']),
-                'crossover_prob': random.choice(profile['crossover_prob']),
-                'crossover': crossover_obj
-            }
-            logger.info(f"Created NSGAII sampler with crossover={crossover_name}, config: {config}")
-            return NSGAIISampler(**config)
-        
-        elif sampler_type == 'nsga3':
-            profile = sampler_profiles['nsga3']
-            population_size = random.choice(profile['population_size'])
-            config = {'population_size': population_size}
-            logger.info(f"Created NSGAIII sampler with config: {config}")
-            return NSGAIIISampler(**config)
-        
-        elif sampler_type == 'random':
-            seed = random.choice(sampler_profiles['random']['seed'])
-            config = {'seed': seed} if seed is not None else {}
-            logger.info(f"Created Random sampler with config: {config}")
-            return RandomSampler(**config)
-        
-        elif sampler_type == 'qmc':
-            seed = random.choice(sampler_profiles['qmc']['seed'])
-            config = {'seed': seed} if seed is not None else {}
-            logger.info(f"Created QMC sampler with config: {config}")
-            return QMCSampler(**config)
-        
-        else:
-            logger.warning(f"Unknown sampler '{sampler_type}', falling back to TPE")
+        factory = _SAMPLER_FACTORIES.get(sampler_type)
+        if factory is None:
+            logger.warning("Unknown sampler '%s', falling back to TPE", sampler_type)
             return TPESampler()
+        return factory(self._rng)
     
     def _get_db_url(self) -> str:
         db_config = {
@@ -326,7 +727,16 @@ class BreederWorker:
             'port': os.environ.get("GODON_ARCHIVE_DB_SERVICE_PORT", "5432"),
             'database': self.breeder_db_name  # Uses breeder_ prefix + UUID with underscores
         }
-        return f"postgresql://{db_config['user']}:{db_config['password']}@{db_config['host']}:{db_config['port']}/{db_config['database']}"
+        return "postgresql://{user}:{password}@{host}:{port}/{database}".format_map(db_config)
+
+    def _get_storage(self) -> optuna.storages.RDBStorage:
+        """Get the RDB storage for this worker, created once with a bounded connection pool"""
+        if self._storage is None:
+            self._storage = optuna.storages.RDBStorage(
+                url=self._db_url,
+                engine_kwargs=_rdb_engine_kwargs(f"godon-{self.worker_id}")
+            )
+        return self._storage
     
     def _load_or_create_study(self) -> optuna.Study:
         # Create sampler-specific study name for algorithm diversity
@@ -336,20 +746,19 @@ class BreederWorker:
         else:
             study_name = f"{self.breeder_id}_study"
         
-        directions = [obj.get('direction') for obj in self.config.get('objectives', [])]
+        directions = list(self._obj_dirs)
         
+        storage = self._get_storage()
+
         try:
-            storage = optuna.storages.RDBStorage(url=self._get_db_url())
             study = optuna.load_study(study_name=study_name, storage=storage)
-            logger.info(f"Loaded existing study: {study_name} with {len(study.trials)} trials")
+            logger.info("Loaded existing study: %s with %s trials", study_name, study._storage.get_n_trials(study._study_id))
         except (KeyError, ValueError):
-            storage = optuna.storages.RDBStorage(url=self._get_db_url())
-            
             # Create sampler if algorithm diversity is enabled
             sampler = None
             if parallel_workers > 1:
                 sampler = self._create_sampler(self.sampler_type)
-                logger.info(f"Created study {study_name} with {self.sampler_type} sampler")
+                logger.info("Created study %s with %s sampler", study_name, self.sampler_type)
             
             study = optuna.create_study(
                 study_name=study_name, 
@@ -357,7 +766,7 @@ class BreederWorker:
                 storage=storage,
                 sampler=sampler
             )
-            logger.info(f"Created new study: {study_name}")
+            logger.info("Created new study: %s", study_name)
         
         return study
     
@@ -373,17 +782,25 @@ class BreederWorker:
             top_percentile = cooperation_config.get('top_percentile', 0.2)
             bottom_percentile = cooperation_config.get('bottom_percentile', 0.2)
             min_trials_for_filtering = cooperation_config.get('min_trials_for_filtering', 10)
-            storage = self._get_db_url()
+            # Reuse the worker's storage (and its connection pool) when available
+            storage = self._storage if self._storage is not None else self._db_url
             
             # If algorithm diversity is enabled (parallel > 1), share within breeder (across sampler-specific studies)
             share_within_breeder = parallel_workers > 1
+            # Those sampler-specific studies are known up front, so the
+            # callback need not list the storage to find them
+            peer_names = None
+            if share_within_breeder:
+                peer_names = tuple(f"{self.breeder_id}_{sampler}_study"
+                                   for sampler in _DIVERSITY_SAMPLERS[:parallel_workers]
+                                   if sampler != self.sampler_type)
             
-            logger.info(f"Communication enabled with strategy: {share_strategy}, share_within_breeder: {share_within_breeder}")
+            logger.info("Communication enabled with strategy: %s, share_within_breeder: %s", share_strategy, share_within_breeder)
             if share_strategy == "probabilistic":
-                logger.info(f"  Probability: {probability}")
+                logger.info("  Probability: %s", probability)
             else:
-                logger.info(f"  Top percentile: {top_percentile}, Bottom percentile: {bottom_percentile}")
-                logger.info(f"  Min trials for filtering: {min_trials_for_filtering}")
+                logger.info("  Top percentile: %s, Bottom percentile: %s", top_percentile, bottom_percentile)
+                logger.info("  Min trials for filtering: %s", min_trials_for_filtering)
             
             return CommunicationCallback(
                 storage=storage,
@@ -392,24 +809,28 @@ class BreederWorker:
                 top_percentile=top_percentile,
                 bottom_percentile=bottom_percentile,
                 min_trials_for_filtering=min_trials_for_filtering,
-                share_within_breeder=share_within_breeder
+                share_within_breeder=share_within_breeder,
+                flush_every=cooperation_config.get('flush_every', 8),
+                flush_interval=cooperation_config.get('flush_interval', 60.0),
+                peer_names=peer_names
             )
         else:
             logger.info("Communication disabled")
             return None
     
-    def _suggest_params(self, trial: optuna.Trial) -> Dict[str, Any]:
+    def _build_param_plan(self) -> Tuple[Tuple[str, str, str, Callable[[optuna.Trial], Any]], ...]:
         """
-        Suggest parameter values using Optuna trial.
+        Flatten the settings config into the parameters suggested on every trial.
 
         v0.3 updates:
         - Support sysctl, sysfs, cpufreq, ethtool categories
-        - Support list of constraints (multiple disjoint ranges)
-        - Support categorical parameters (suggest_categorical)
-        - Support float parameters (suggest_float)
         - Handle ethtool's nested structure (interface → parameters)
+
+        Returns:
+            Tuple of (params key, Optuna parameter name, category, suggest) entries,
+            where suggest(trial) is the parameter's bound Optuna suggest call
         """
-        params = {}
+        plan = []
 
         # Support multiple settings categories
         supported_categories = ['sysctl', 'sysfs', 'cpufreq', 'ethtool']
@@ -425,93 +846,54 @@ class BreederWorker:
             if category == 'ethtool':
                 for interface_name, interface_config in category_settings.items():
                     if not isinstance(interface_config, dict):
-                        logger.warning(f"Invalid ethtool config for {interface_name}: not a dict")
+                        logger.warning("Invalid ethtool config for %s: not a dict", interface_name)
                         continue
 
                     for param_name, param_config in interface_config.items():
                         if 'constraints' not in param_config:
-                            logger.warning(f"Missing constraints for ethtool.{interface_name}.{param_name}")
+                            logger.warning("Missing constraints for ethtool.%s.%s", interface_name, param_name)
                             continue
 
-                        # Suggest value for this parameter
-                        value = self._suggest_single_param(
-                            trial, param_name, param_config['constraints'],
-                            category=f"ethtool.{interface_name}"
-                        )
                         # Store with interface prefix
-                        params[f"{interface_name}_{param_name}"] = value
-                        logger.debug(f"Suggested ethtool.{interface_name}.{param_name} = {value}")
+                        plan.append((f"{interface_name}_{param_name}", param_name,
+                                     param_config['constraints'], f"ethtool.{interface_name}"))
 
             # Non-ethtool categories (sysctl, sysfs, cpufreq)
             else:
                 for param_name, param_config in category_settings.items():
                     if 'constraints' not in param_config:
-                        logger.warning(f"Missing constraints for {category}.{param_name}")
+                        logger.warning("Missing constraints for %s.%s", category, param_name)
                         continue
 
-                    constraints = param_config['constraints']
+                    plan.append((param_name, param_name, param_config['constraints'], category))
 
-                    # Suggest value for this parameter
-                    value = self._suggest_single_param(trial, param_name, constraints, category=category)
-                    params[param_name] = value
-                    logger.debug(f"Suggested {category}.{param_name} = {value}")
+        bound_plan = []
+        for key, param_name, constraints, category in plan:
+            try:
+                suggest = _bind_suggest(param_name, constraints, category)
+            except ValueError as e:
+                suggest = _failing_suggest(e)
+            bound_plan.append((key, param_name, category, suggest))
 
-        return params
+        return tuple(bound_plan)
 
-    def _suggest_single_param(self, trial: optuna.Trial, param_name: str,
-                             constraints_list: List[Dict[str, Any]], category: str) -> Any:
+    def _suggest_params(self, trial: optuna.Trial) -> Dict[str, Any]:
         """
-        Suggest a value for a single parameter using Optuna.
-
-        v0.3: Supports list of constraints with multiple disjoint ranges or categorical values.
+        Suggest parameter values using Optuna trial.
 
-        Args:
-            trial: Optuna trial object
-            param_name: Parameter name
-            constraints_list: List of constraint objects (ranges or categorical)
-            category: Parameter category (for error messages)
+        v0.3 updates:
+        - Support list of constraints (multiple disjoint ranges)
+        - Support categorical parameters (suggest_categorical)
+        - Support float parameters (suggest_float)
+        """
+        params = {}
 
-        Returns:
-            Suggested parameter value (int, float, or str)
+        for key, param_name, category, suggest in self._param_plan:
+            params[key] = value = suggest(trial)
+            logger.debug("Suggested %s.%s = %s", category, param_name, value)
 
-        Raises:
-            ValueError: If constraint structure is invalid
-        """
-        if not isinstance(constraints_list, list) or len(constraints_list) == 0:
-            raise ValueError(f"{category}.{param_name}: constraints must be a non-empty list")
-
-        # Check constraint type from first constraint
-        first_constraint = constraints_list[0]
-
-        # Categorical parameter (has 'values')
-        if 'values' in first_constraint:
-            # For categorical, use first constraint's values
-            # (multiple categorical constraints don't make sense)
-            values = first_constraint['values']
-            return trial.suggest_categorical(param_name, values)
-
-        # Integer/float range (has 'step', 'lower', 'upper')
-        elif 'step' in first_constraint and 'lower' in first_constraint and 'upper' in first_constraint:
-            # Multiple disjoint ranges - use first range for suggestion
-            # Note: Optuna doesn't support disjoint ranges directly, so we use the first range
-            # The sharding logic in controller distributes different ranges to different workers
-            constraint = first_constraint
-            lower = constraint['lower']
-            upper = constraint['upper']
-            step = constraint['step']
-
-            # Determine if integer or float based on step type
-            if isinstance(step, int) and isinstance(lower, int) and isinstance(upper, int):
-                return trial.suggest_int(param_name, lower, upper, step=step)
-            else:
-                return trial.suggest_float(param_name, lower, upper, step=step)
+        return params
 
-        else:
-            raise ValueError(
-                f"{category}.{param_name}: constraint must have either 'values' (categorical) "
-                f"or 'step/lower/upper' (numeric range)"
-            )
-    
     def _execute_trial(self, params: Dict[str, Any]) -> Dict[str, float]:
         flow_path = "f/breeder/linux_performance/effectuation_flow"
 
@@ -524,27 +906,49 @@ class BreederWorker:
             'params': params
         }
 
-        logger.info(f"Executing effectuation flow for {len(targets)} targets with params: {list(params.keys())}")
+        logger.info("Executing effectuation flow for %s targets with params: %s", len(targets), list(params.keys()))
 
         try:
             job_id = wmill.run_flow_async(path=flow_path, args=flow_inputs)
-            logger.debug(f"Effectuation flow job ID: {job_id}")
+            logger.debug("Effectuation flow job ID: %s", job_id)
 
             result = wmill.get_result(job_id)
-            logger.info(f"Effectuation flow completed: {result.get('status')}")
+            logger.info("Effectuation flow completed: %s", result.get('status'))
 
             # Extract metrics from reconnaissance step
             metrics = result.get('metrics', {})
             if not metrics:
                 logger.error("No metrics returned from effectuation flow")
-                return {obj.get('name'): float('inf') for obj in self.config.get('objectives', [])}
+                return dict(self._penalty)
 
             return metrics
 
         except Exception as e:
-            logger.error(f"Effectuation flow failed: {e}", exc_info=True)
+            logger.error("Effectuation flow failed: %s", e, exc_info=True)
             # Return penalty values for failed trials
-            return {obj.get('name'): float('inf') for obj in self.config.get('objectives', [])}
+            return dict(self._penalty)
+
+    def _build_guardrail_limits(self) -> Tuple[Tuple[str, float], ...]:
+        """
+        Collect the (name, hard_limit) pairs of guardrails that can be checked.
+
+        Guardrails without a hard limit or with a non-numeric one are
+        reported once here and skipped.
+        """
+        limits = []
+
+        for guardrail in self.config.get('guardrails', []):
+            name = guardrail.get('name', 'unknown')
+            hard_limit = guardrail.get('hard_limit')
+
+            if not hard_limit:
+                logger.warning("Guardrail '%s' missing hard_limit, skipping", name)
+            elif not isinstance(hard_limit, (int, float)):
+                logger.warning("Guardrail '%s' has non-numeric hard_limit, skipping", name)
+            else:
+                limits.append((name, hard_limit))
+
+        return tuple(limits)
 
     def _check_guardrails(self, metrics: Dict[str, float]) -> tuple[bool, list[str]]:
         """
@@ -561,46 +965,33 @@ class BreederWorker:
                 - violated: True if any guardrail was exceeded
                 - violations_list: List of violation messages
         """
-        guardrails = self.config.get('guardrails', [])
-
-        if not guardrails:
+        if not self._guardrail_limits:
             # No guardrails configured
             return False, []
 
         violations = []
 
-        for guardrail in guardrails:
-            name = guardrail.get('name', 'unknown')
-            hard_limit = guardrail.get('hard_limit')
-            reconnaissance = guardrail.get('reconnaissance', {})
-
-            if not hard_limit:
-                logger.warning(f"Guardrail '{name}' missing hard_limit, skipping")
-                continue
-
+        for name, hard_limit in self._guardrail_limits:
             # Extract guardrail metric from results
             # Guardrail metrics should be collected by effectuation flow
             # and returned in the metrics dict
             metric_value = metrics.get(name)
 
             if metric_value is None:
-                logger.warning(f"Guardrail '{name}' metric not found in metrics, skipping check")
+                logger.warning("Guardrail '%s' metric not found in metrics, skipping check", name)
                 continue
 
             # Determine if guardrail is violated
             # Direction inferred from parameter semantics
             # For common metrics (CPU, errors, latency) = must not exceed
             # Future enhancement: Add explicit direction field to guardrail config
-            if isinstance(hard_limit, (int, float)):
-                # Assume "must not exceed" for common safety metrics
-                if metric_value > hard_limit:
-                    violation_msg = f"Guardrail '{name}' violated: {metric_value} > {hard_limit}"
-                    violations.append(violation_msg)
-                    logger.error(violation_msg)
-                else:
-                    logger.debug(f"Guardrail '{name}' OK: {metric_value} <= {hard_limit}")
+            # Assume "must not exceed" for common safety metrics
+            if metric_value > hard_limit:
+                violation_msg = f"Guardrail '{name}' violated: {metric_value} > {hard_limit}"
+                violations.append(violation_msg)
+                logger.error(violation_msg)
             else:
-                logger.warning(f"Guardrail '{name}' has non-numeric hard_limit, skipping")
+                logger.debug("Guardrail '%s' OK: %s <= %s", name, metric_value, hard_limit)
 
         return len(violations) > 0, violations
 
@@ -619,11 +1010,10 @@ class BreederWorker:
         # Check if already initialized
         existing_state = self.study.user_attrs.get(state_key)
         if existing_state:
-            logger.debug(f"Rollback state already initialized for target {self.target_id}")
+            logger.debug("Rollback state already initialized for target %s", self.target_id)
             return
 
         # Initialize default rollback state
-        import json
         initial_state = {
             'state': 'normal',  # normal, needs_rollback, in_progress, completed
             'consecutive_failures': 0,
@@ -632,45 +1022,114 @@ class BreederWorker:
             'version': 0  # For optimistic locking
         }
 
-        self.study.set_user_attr(state_key, json.dumps(initial_state))
-        logger.info(f"Initialized rollback state for target {self.target_id}: {initial_state}")
+        self.study.set_user_attr(state_key, json.dumps(initial_state, separators=(',', ':')))
+        logger.info("Initialized rollback state for target %s: %s", self.target_id, initial_state)
 
     def _get_rollback_state(self) -> Dict[str, Any]:
-        """Load rollback state from Optuna study user_attrs"""
-        import json
-
+        """Get a copy of the rollback state, loading it from the study on first use"""
+        if self._rollback_state is None:
+            self._refresh_rollback_state()
+        return dict(self._rollback_state)
+
+    def _rollback_state_field(self, key: str, default: Any = None) -> Any:
+        """Read one rollback state field without copying the state"""
+        if self._rollback_state is None:
+            self._refresh_rollback_state()
+        return self._rollback_state.get(key, default)
+
+    def _refresh_rollback_state(self) -> None:
+        """Load rollback state from Optuna study user_attrs, dropping unwritten changes"""
         state_key = self._get_rollback_state_key()
         state_json = self.study.user_attrs.get(state_key)
 
         if not state_json:
-            logger.warning(f"No rollback state found for target {self.target_id}, initializing")
+            logger.warning("No rollback state found for target %s, initializing", self.target_id)
             self._init_rollback_state()
             state_json = self.study.user_attrs.get(state_key)
 
-        return json.loads(state_json)
+        self._rollback_state = json.loads(state_json)
+        self._rollback_dirty = False
 
-    def _update_rollback_state(self, new_state: Dict[str, Any]) -> bool:
+    def _update_rollback_state(self, new_state: Dict[str, Any], flush: bool = True) -> bool:
         """
         Update rollback state in Optuna study with optimistic locking.
 
         Args:
-            new_state: New rollback state to write
+            new_state: New rollback state to write; the worker keeps this
+                dict, so callers pass a copy they no longer modify (as returned
+                by _get_rollback_state)
+            flush: Write to the study now; otherwise keep the change in memory
+                until the next _flush_rollback_state
 
         Returns:
             bool: True if update succeeded, False if version conflict
         """
-        import json
+        # Nothing to record when the state is unchanged (callers work on
+        # copies of the current state, so equal content means no update)
+        if new_state == self._rollback_state and (not flush or not self._rollback_dirty):
+            return True
+
+        if not flush:
+            self._rollback_state = new_state
+            self._rollback_dirty = True
+            return True
 
         state_key = self._get_rollback_state_key()
 
+        # Compare-and-swap on the version: the update is based on the version
+        # last read or written by this worker; another writer of the target
+        # has bumped it since, so take over its state instead of clobbering it
+        base_version = new_state.get('version', 0)
+        stored_json = self.study.user_attrs.get(state_key)
+        stored_version = json.loads(stored_json).get('version', 0) if stored_json else 0
+        if stored_version != base_version:
+            logger.warning("Rollback state of target %s changed concurrently (version %s, expected %s), reloading",
+                           self.target_id, stored_version, base_version)
+            self._refresh_rollback_state()
+            return False
+
         # Increment version for optimistic locking
-        new_state['version'] = new_state.get('version', 0) + 1
+        new_state['version'] = base_version + 1
 
-        self.study.set_user_attr(state_key, json.dumps(new_state))
-        logger.debug(f"Updated rollback state for target {self.target_id}: version={new_state['version']}, state={new_state['state']}")
+        self.study.set_user_attr(state_key, json.dumps(new_state, separators=(',', ':')))
+        self._rollback_state = new_state
+        self._rollback_dirty = False
+        logger.debug("Updated rollback state for target %s: version=%s, state=%s", self.target_id, new_state['version'], new_state['state'])
 
         return True
 
+    def _flush_rollback_state(self) -> None:
+        """Write deferred rollback state changes to the study"""
+        if not self._rollback_dirty:
+            return
+
+        pending = self._rollback_state
+        if not self._update_rollback_state(pending):
+            # Only successes on a healthy target are deferred, so the last
+            # successful params are the change to keep on top of the reloaded state
+            self._write_rollback_changes({'last_successful_params': pending.get('last_successful_params')})
+
+    def _write_rollback_changes(self, changes: Dict[str, Any]) -> bool:
+        """
+        Apply field changes to the current rollback state and write it,
+        re-applying them once on top of the reloaded state after a version conflict.
+
+        Args:
+            changes: Rollback state fields to set
+
+        Returns:
+            bool: True if the changes were written
+        """
+        for _ in range(_ROLLBACK_UPDATE_ATTEMPTS):
+            rollback_state = self._get_rollback_state()
+            rollback_state.update(changes)
+            if self._update_rollback_state(rollback_state):
+                return True
+
+        logger.warning("Dropped rollback state update %s for target %s after repeated version conflicts",
+                       changes, self.target_id)
+        return False
+
     def _check_needs_rollback(self) -> bool:
         """
         Check if rollback is needed based on consecutive failures threshold.
@@ -681,18 +1140,12 @@ class BreederWorker:
         if not self.rollback_enabled:
             return False
 
-        rollback_state = self._get_rollback_state()
-        consecutive_failures = rollback_state.get('consecutive_failures', 0)
-
-        # Get rollback strategy configuration
-        strategy_name = self.rollback_config.get('strategy', 'standard')
-        strategies = self.config.get('rollback_strategies', {})
-        strategy = strategies.get(strategy_name, {})
+        consecutive_failures = self._rollback_state_field('consecutive_failures', 0)
 
-        threshold = strategy.get('consecutive_failures', 3)
+        threshold = self._rollback_threshold
 
         if consecutive_failures >= threshold:
-            logger.warning(f"Consecutive failures ({consecutive_failures}) >= threshold ({threshold}), rollback needed")
+            logger.warning("Consecutive failures (%s) >= threshold (%s), rollback needed", consecutive_failures, threshold)
             return True
 
         return False
@@ -704,14 +1157,10 @@ class BreederWorker:
         Returns:
             bool: True if rollback succeeded, False otherwise
         """
-        import json
-
-        logger.info(f"Executing rollback for target {self.target_id}")
+        logger.info("Executing rollback for target %s", self.target_id)
 
         rollback_state = self._get_rollback_state()
-        strategy_name = self.rollback_config.get('strategy', 'standard')
-        strategies = self.config.get('rollback_strategies', {})
-        strategy = strategies.get(strategy_name, {})
+        strategy = self._rollback_strategy
 
         # Determine which parameters to restore
         target_state = strategy.get('target_state', 'previous')  # previous, best, baseline
@@ -720,8 +1169,9 @@ class BreederWorker:
             params_to_restore = rollback_state.get('last_successful_params')
         elif target_state == 'best':
             # Get first Pareto-optimal trial for deterministic rollback
-            if self.study.best_trials:
-                params_to_restore = self.study.best_trials[0].params
+            best_trials = self.study.best_trials
+            if best_trials:
+                params_to_restore = best_trials[0].params
             else:
                 logger.error("Cannot rollback to 'best': no best trial found")
                 return False
@@ -729,14 +1179,14 @@ class BreederWorker:
             # Baseline = no tuning applied (use config defaults)
             params_to_restore = {}
         else:
-            logger.error(f"Unknown target_state: {target_state}")
+            logger.error("Unknown target_state: %s", target_state)
             return False
 
         if params_to_restore is None:
-            logger.error(f"No parameters to restore for target_state={target_state}")
+            logger.error("No parameters to restore for target_state=%s", target_state)
             return False
 
-        logger.info(f"Rolling back to {target_state} state with params: {list(params_to_restore.keys())}")
+        logger.info("Rolling back to %s state with params: %s", target_state, list(params_to_restore.keys()))
 
         # Execute rollback by calling effectuation flow
         try:
@@ -748,49 +1198,43 @@ class BreederWorker:
                 'params': params_to_restore
             }
 
-            logger.info(f"Executing rollback effectuation flow for target {self.target_id}")
+            logger.info("Executing rollback effectuation flow for target %s", self.target_id)
             job_id = wmill.run_flow_async(path=flow_path, args=flow_inputs)
             result = wmill.get_result(job_id)
 
-            logger.info(f"Rollback effectuation completed: {result.get('status')}")
+            logger.info("Rollback effectuation completed: %s", result.get('status'))
 
-            # Update rollback state to completed
-            rollback_state['state'] = 'completed'
-            rollback_state['consecutive_failures'] = 0  # Reset counter
-            self._update_rollback_state(rollback_state)
+            # Update rollback state to completed, resetting the counter
+            self._write_rollback_changes({'state': 'completed', 'consecutive_failures': 0})
 
-            # Track successful rollback
+            # Track successful rollback; pushed with the next progress
+            # report or on shutdown
             self.metrics.inc_rollback('success')
-            self.metrics.push()
 
             return True
 
         except Exception as e:
-            logger.error(f"Rollback execution failed: {e}", exc_info=True)
+            logger.error("Rollback execution failed: %s", e, exc_info=True)
 
             # Track failed rollback
             self.metrics.inc_rollback('failed')
-            self.metrics.push()
 
             # Handle rollback failure based on on_failure policy
             on_failure = strategy.get('on_failure', 'stop')
 
             if on_failure == 'stop':
                 logger.error("Rollback failed with on_failure=stop, halting optimization")
-                rollback_state['state'] = 'failed'
-                self._update_rollback_state(rollback_state)
+                self._write_rollback_changes({'state': 'failed'})
                 raise  # Re-raise to stop worker
 
             elif on_failure == 'continue':
                 logger.warning("Rollback failed with on_failure=continue, continuing optimization")
-                rollback_state['state'] = 'failed'
-                self._update_rollback_state(rollback_state)
+                self._write_rollback_changes({'state': 'failed'})
                 return False
 
             elif on_failure == 'skip_target':
                 logger.error("Rollback failed with on_failure=skip_target, marking target unhealthy")
-                rollback_state['state'] = 'skip_target'
-                self._update_rollback_state(rollback_state)
+                self._write_rollback_changes({'state': 'skip_target'})
                 return False
 
             return False
@@ -805,21 +1249,29 @@ class BreederWorker:
         if not self.rollback_enabled:
             return
 
-        rollback_state = self._get_rollback_state()
+        # On a version conflict the stored state was reloaded; count the
+        # violation again on top of it
+        for _ in range(_ROLLBACK_UPDATE_ATTEMPTS):
+            rollback_state = self._get_rollback_state()
 
-        # Increment consecutive failures counter
-        rollback_state['consecutive_failures'] = rollback_state.get('consecutive_failures', 0) + 1
+            # Increment consecutive failures counter
+            consecutive_failures = rollback_state.get('consecutive_failures', 0) + 1
+            rollback_state['consecutive_failures'] = consecutive_failures
 
-        consecutive_failures = rollback_state['consecutive_failures']
-        logger.warning(f"Guardrail violation detected. Consecutive failures: {consecutive_failures}")
+            # Update state; judged on the incremented count, _check_needs_rollback
+            # would still see the stored one
+            if consecutive_failures >= self._rollback_threshold:
+                rollback_state['state'] = 'needs_rollback'
+            else:
+                rollback_state['state'] = 'normal'
 
-        # Update state
-        if self._check_needs_rollback():
-            rollback_state['state'] = 'needs_rollback'
+            if self._update_rollback_state(rollback_state):
+                break
         else:
-            rollback_state['state'] = 'normal'
+            logger.warning("Dropped guardrail violation count for target %s after repeated version conflicts",
+                           self.target_id)
 
-        self._update_rollback_state(rollback_state)
+        logger.warning("Guardrail violation detected. Consecutive failures: %s", consecutive_failures)
 
     def _handle_successful_trial(self, params: Dict[str, Any]) -> None:
         """
@@ -831,38 +1283,95 @@ class BreederWorker:
         if not self.rollback_enabled:
             return
 
-        rollback_state = self._get_rollback_state()
+        # On a version conflict the stored state was reloaded; reset it again
+        for _ in range(_ROLLBACK_UPDATE_ATTEMPTS):
+            rollback_state = self._get_rollback_state()
+
+            # While the target stays healthy only the last successful params
+            # change; those are written with the next progress update
+            transition = rollback_state.get('consecutive_failures', 0) != 0 or rollback_state.get('state') != 'normal'
+
+            # Reset consecutive failures on success
+            rollback_state['consecutive_failures'] = 0
+            rollback_state['state'] = 'normal'
+            rollback_state['last_successful_params'] = params
 
-        # Reset consecutive failures on success
-        rollback_state['consecutive_failures'] = 0
-        rollback_state['state'] = 'normal'
-        rollback_state['last_successful_params'] = params
+            if self._update_rollback_state(rollback_state, flush=transition):
+                break
+        else:
+            logger.warning("Dropped failure counter reset for target %s after repeated version conflicts",
+                           self.target_id)
 
-        self._update_rollback_state(rollback_state)
-        logger.debug(f"Reset consecutive failures after successful trial")
+        logger.debug("Reset consecutive failures after successful trial")
     
-    def _should_continue(self) -> bool:
-        completion_criteria = self.config.get('run', {}).get('completion_criteria', {})
+    def _update_best_value(self, frozen_trial: optuna.trial.FrozenTrial) -> None:
+        """Report a told trial's value as the best value if it is the new best"""
+        # Optuna tells a trial missing an objective value as FAIL
+        if frozen_trial.state != TrialState.COMPLETE:
+            return
 
-        min_iterations = completion_criteria.get('iterations', {}).get('min', 10)
-        max_iterations = completion_criteria.get('iterations', {}).get('max', 1000)
+        values = frozen_trial.values
+        if len(values) == 1:
+            if self._improves_best(values[0]):
+                self.metrics.set_best_value(values[0])
+        else:
+            best_trials = self.study.best_trials
+            if best_trials and best_trials[0].number == frozen_trial.number:
+                self.metrics.set_best_value(values[0])
 
-        n_trials = len(self.study.trials)
+    def _study_best_value(self) -> Optional[float]:
+        """Best value across all trials in the study, None if not single-objective or none completed"""
+        if len(self._obj_names) != 1:
+            return None
+        try:
+            return self.study.best_value
+        except ValueError:
+            return None  # no completed trials yet
+
+    def _refresh_best_value(self) -> None:
+        """Catch the tracked best value up with trials shared in by cooperating workers"""
+        if self._improves_best(self._study_best_value()):
+            self.metrics.set_best_value(self._best_value)
+
+    def _improves_best(self, value: Optional[float]) -> bool:
+        """Record value as the best so far if it beats the current one"""
+        if value is None:
+            return False
+
+        best = self._best_value
+        if best is None or (value > best if self._maximize else value < best):
+            self._best_value = value
+            return True
+        return False
+
+    def _n_trials(self) -> int:
+        """Count the study's trials without the deep copies study.trials makes
+
+        Optuna storages count by listing the trials (deepcopy=False), served
+        from the cached storage's trial cache for RDB storage.
+        """
+        return self.study._storage.get_n_trials(self.study._study_id)
+
+    def _should_continue(self) -> bool:
+        min_iterations = self._min_iterations
+        max_iterations = self._max_iterations
+
+        n_trials = self._n_trials()
 
         if n_trials < min_iterations:
-            logger.debug(f"Continuing: {n_trials} < {min_iterations} min iterations")
+            logger.debug("Continuing: %s < %s min iterations", n_trials, min_iterations)
             return True
         if n_trials >= max_iterations:
-            logger.info(f"Stopping: {n_trials} >= {max_iterations} max iterations")
+            logger.info("Stopping: %s >= %s max iterations", n_trials, max_iterations)
             return False
 
         # Check time budget
-        if self._check_time_budget(completion_criteria):
+        if self._check_time_budget():
             logger.info("Stopping: Time budget exceeded")
             return False
 
         # Check quality thresholds
-        if completion_criteria.get('quality_achieved', False):
+        if self._quality_achieved:
             if self._check_quality_thresholds():
                 logger.info("Stopping: All quality thresholds achieved")
                 return False
@@ -892,7 +1401,7 @@ class BreederWorker:
                 row = result.fetchone()
                 shutdown_requested = row[0] if row else False
                 if shutdown_requested:
-                    logger.info(f"Shutdown flag is set for breeder {self.breeder_uuid}")
+                    logger.info("Shutdown flag is set for breeder %s", self.breeder_uuid)
                     return True
 
             return False
@@ -900,69 +1409,64 @@ class BreederWorker:
         except Exception as e:
             # Table might not exist in older breeders, or other DB error
             # Log warning but don't crash the worker
-            logger.warning(f"Failed to check shutdown flag: {e}")
+            logger.warning("Failed to check shutdown flag: %s", e)
             return False
     
-    def _check_time_budget(self, completion_criteria: dict) -> bool:
-        """Check if time budget has been exceeded"""
-        timing_config = completion_criteria.get('timing', {})
-        end_time_str = timing_config.get('end')
-        
+    def _parse_time_budget(self) -> Optional[datetime.datetime]:
+        """Deadline set by the completion criteria's time budget, None if there is none"""
+        completion_criteria = self.config.get('run', {}).get('completion_criteria', {})
+        end_time_str = completion_criteria.get('timing', {}).get('end')
+
         if not end_time_str:
-            return False
-        
-        if not hasattr(self, 'start_time'):
-            return False
-        
+            return None
+
         # Parse time string (e.g., "7d", "24h", "60m")
-        import re
-        match = re.match(r'(\d+)([dhm])', end_time_str)
+        match = _TIME_BUDGET_RE.match(end_time_str)
         if not match:
-            logger.warning(f"Invalid time format: {end_time_str}")
-            return False
-        
+            logger.warning("Invalid time format: %s", end_time_str)
+            return None
+
         value, unit = match.groups()
-        value = int(value)
-        
-        # Convert to seconds
-        unit_seconds = {'d': 86400, 'h': 3600, 'm': 60}
-        budget_seconds = value * unit_seconds[unit]
-        
-        elapsed_seconds = (datetime.datetime.now() - self.start_time).total_seconds()
-        
-        return elapsed_seconds >= budget_seconds
+        budget_seconds = int(value) * _TIME_UNIT_SECONDS[unit]
+
+        return self.start_time + datetime.timedelta(seconds=budget_seconds)
+
+    def _check_time_budget(self) -> bool:
+        """Check if time budget has been exceeded"""
+        deadline = self._budget_deadline
+        if deadline is None:
+            return False
+
+        # Compare in the creation timestamp's timezone; it is UTC-aware
+        # when the controller writes a 'Z' suffix
+        return datetime.datetime.now(deadline.tzinfo) >= deadline
     
+    def _build_quality_thresholds(self) -> Optional[Tuple[Tuple[bool, float], ...]]:
+        """Flatten the objectives' quality thresholds for _check_quality_thresholds"""
+        # Check if all objectives have quality_threshold defined
+        if not self._objectives or any('quality_threshold' not in obj for obj in self._objectives):
+            return None
+
+        return tuple(
+            (obj.get('direction', 'minimize') == 'maximize', obj['quality_threshold'])
+            for obj in self._objectives
+        )
+
     def _check_quality_thresholds(self) -> bool:
         """Check if ANY Pareto-optimal trial meets all quality thresholds"""
-        if not self.study.best_trials:
+        thresholds = self._quality_thresholds
+        if thresholds is None:
             return False
 
-        objectives = self.config.get('objectives', [])
-        if not objectives:
+        # The Pareto front is recomputed on every access, fetch it once
+        best_trials = self.study.best_trials
+        if not best_trials:
             return False
 
-        # Check if all objectives have quality_threshold defined
-        for objective in objectives:
-            if 'quality_threshold' not in objective:
-                return False
-
         # Check if ANY trial in the Pareto front meets ALL thresholds
-        for trial in self.study.best_trials:
-            all_thresholds_met = True
-            for obj_value, objective in zip(trial.values, objectives):
-                threshold = objective.get('quality_threshold')
-                direction = objective.get('direction', 'minimize')
-
-                if direction == 'minimize':
-                    if obj_value > threshold:
-                        all_thresholds_met = False
-                        break
-                elif direction == 'maximize':
-                    if obj_value < threshold:
-                        all_thresholds_met = False
-                        break
-
-            if all_thresholds_met:
+        for trial in best_trials:
+            if all(obj_value >= threshold if maximize else obj_value <= threshold
+                   for obj_value, (maximize, threshold) in zip(trial.values, thresholds)):
                 return True  # At least one trial meets all thresholds
 
         return False  # No trial meets all thresholds
@@ -975,23 +1479,29 @@ class BreederWorker:
         """
         state = {
             'breeder_id': self.breeder_id,
-            'total_trials': len(self.study.trials),
+            'total_trials': self._n_trials(),
             'study_name': self.study.study_name,
             'status': 'running'
         }
 
+        # Skip the round-trip when nothing changed since the last update
+        if state == self._last_state:
+            return
+
         wmill.set_state(state)
-        logger.debug(f"Updated Windmill state: {state}")
+        self._last_state = state
+        logger.debug("Updated Windmill state: %s", state)
     
     def run(self):
-        logger.info(f"Starting BreederWorker: {self.worker_id}")
-        logger.info(f"Breeder type: {self.breeder_type}, UUID: {self.breeder_uuid}")
+        logger.info("Starting BreederWorker: %s", self.worker_id)
+        logger.info("Breeder type: %s, UUID: %s", self.breeder_type, self.breeder_uuid)
 
         # Mark worker as running
         self.metrics.mark_running()
         self.metrics.push()
 
-        trial_count = 0
+        pending_progress = 0
+        last_progress = time.monotonic()
 
         try:
             while self._should_continue():
@@ -1006,16 +1516,12 @@ class BreederWorker:
                         logger.warning("Rollback failed, continuing with trials")
 
                     # Apply after-action policy (pause/continue/stop)
-                    rollback_state = self._get_rollback_state()
-                    strategy_name = self.rollback_config.get('strategy', 'standard')
-                    strategies = self.config.get('rollback_strategies', {})
-                    strategy = strategies.get(strategy_name, {})
-                    after_policy = strategy.get('after', {})
+                    after_policy = self._rollback_strategy.get('after', {})
                     after_action = after_policy.get('action', 'continue')
 
                     if after_action == 'pause':
                         pause_duration = after_policy.get('duration', 300)
-                        logger.info(f"Pausing for {pause_duration} seconds after rollback")
+                        logger.info("Pausing for %s seconds after rollback", pause_duration)
                         time.sleep(pause_duration)
                     elif after_action == 'stop':
                         logger.info("Rollback completed with after.action=stop, halting optimization")
@@ -1023,7 +1529,7 @@ class BreederWorker:
                     # continue = just continue to next trial
 
                 trial = self.study.ask()
-                logger.info(f"Trial {trial.number} started")
+                logger.info("Trial %s started", trial.number)
 
                 trial_start_time = time.time()
 
@@ -1038,9 +1544,9 @@ class BreederWorker:
 
                     if guardrails_violated:
                         # Guardrail violation - mark trial as failed
-                        logger.error(f"Trial {trial.number} failed guardrails: {violations}")
+                        logger.error("Trial %s failed guardrails: %s", trial.number, violations)
                         self.study.tell(trial, state=TrialState.FAIL)
-                        logger.info(f"Trial {trial.number} marked as FAILED (guardrail violation)")
+                        logger.info("Trial %s marked as FAILED (guardrail violation)", trial.number)
 
                         # Track guardrail violations
                         for violation_msg in violations:
@@ -1055,12 +1561,12 @@ class BreederWorker:
                         self.metrics.inc_effectuation('failure')
                     else:
                         # No guardrail violations - accept trial results
-                        values = [metrics.get(obj.get('name')) for obj in self.config.get('objectives', [])]
-                        self.study.tell(trial, values)
+                        values = [metrics.get(name) for name in self._obj_names]
+                        frozen_trial = self.study.tell(trial, values)
 
                         trial_duration = time.time() - trial_start_time
 
-                        logger.info(f"Trial {trial.number} completed with values: {values}")
+                        logger.info("Trial %s completed with values: %s", trial.number, values)
 
                         # Update metrics
                         self.metrics.inc_trial('complete', value=values[0] if values else None)
@@ -1068,14 +1574,12 @@ class BreederWorker:
                         self.metrics.inc_effectuation('success')
 
                         # Update best value if this is the new best
-                        if self.study.best_trials[0] and self.study.best_trials[0].number == trial.number:
-                            self.metrics.set_best_value(values[0] if values else 0)
+                        self._update_best_value(frozen_trial)
 
                         # Reset failure counter on successful trial
                         self._handle_successful_trial(params)
 
                         if self.communication_callback:
-                            frozen_trial = self.study.trials[-1]
                             self.communication_callback(self.study, frozen_trial)
 
                             # Track shared trials
@@ -1083,16 +1587,21 @@ class BreederWorker:
                             share_strategy = coop_config.get('share_strategy', 'unknown')
                             self.metrics.inc_trial_shared(share_strategy)
 
-                    trial_count += 1
-                    if trial_count % 5 == 0:
+                    pending_progress += 1
+                    if (pending_progress >= _PROGRESS_EVERY_TRIALS
+                            or time.monotonic() - last_progress >= _PROGRESS_INTERVAL):
                         self._update_state()
-                        self.metrics.set_total_trials(len(self.study.trials))
-                        self.metrics.push()  # Push metrics every 5 trials
+                        self._flush_rollback_state()
+                        self._refresh_best_value()
+                        self.metrics.set_total_trials(self._n_trials())
+                        self.metrics.push()
+                        pending_progress = 0
+                        last_progress = time.monotonic()
 
                 except Exception as e:
-                    logger.error(f"Trial {trial.number} failed: {e}", exc_info=True)
+                    logger.error("Trial %s failed: %s", trial.number, e, exc_info=True)
                     self.study.tell(trial, state=TrialState.FAIL)
-                    logger.info(f"Trial {trial.number} marked as FAILED")
+                    logger.info("Trial %s marked as FAILED", trial.number)
 
                     # Track failed trial
                     self.metrics.inc_trial('failed')
@@ -1103,23 +1612,34 @@ class BreederWorker:
                     self._handle_guardrail_violation(params)
 
         except Exception as e:
-            logger.error(f"Breeder {self.breeder_id} failed: {e}", exc_info=True)
+            logger.error("Breeder %s failed: %s", self.breeder_id, e, exc_info=True)
             self._update_state()
             raise
         finally:
+            try:
+                self._flush_rollback_state()
+            except Exception as e:
+                logger.warning("Failed to write rollback state: %s", e)
+
+            # Hand over trials still waiting to be shared
+            if self.communication_callback:
+                self.communication_callback.flush()
+
             # Always mark worker as stopped
             self.metrics.mark_stopped()
             self.metrics.push()
+            self.metrics.close()
 
         self._update_state()
-        logger.info(f"BreederWorker {self.worker_id} completed {len(self.study.trials)} trials")
+        logger.info("BreederWorker %s completed %s trials", self.worker_id, self._n_trials())
 
-        if self.study.best_trials:
-            logger.info(f"Found {len(self.study.best_trials)} Pareto-optimal trials")
-            for i, trial in enumerate(self.study.best_trials[:3]):  # Log first 3
-                logger.info(f"  Trial {i+1}: #{trial.number}, values={trial.values}, params={trial.params}")
-            if len(self.study.best_trials) > 3:
-                logger.info(f"  ... and {len(self.study.best_trials) - 3} more")
+        best_trials = self.study.best_trials
+        if best_trials:
+            logger.info("Found %s Pareto-optimal trials", len(best_trials))
+            for i, trial in enumerate(best_trials[:3]):  # Log first 3
+                logger.info("  Trial %s: #%s, values=%s, params=%s", i+1, trial.number, trial.values, trial.params)
+            if len(best_trials) > 3:
+                logger.info("  ... and %s more", len(best_trials) - 3)
 
 
 def main(config: Dict[str, Any], breeder_id: str = None, run_id: int = None, target_id: int = None) -> Dict[str, Any]:
@@ -1136,7 +1656,7 @@ def main(config: Dict[str, Any], breeder_id: str = None, run_id: int = None, tar
         Worker execution results
     """
     if breeder_id:
-        logger.info(f"Starting worker for breeder: {breeder_id}, run: {run_id}, target: {target_id}")
+        logger.info("Starting worker for breeder: %s, run: %s, target: %s", breeder_id, run_id, target_id)
     
     worker = BreederWorker(config)
     worker.run()
@@ -1147,7 +1667,7 @@ def main(config: Dict[str, Any], breeder_id: str = None, run_id: int = None, tar
         'breeder_id': worker.breeder_id,
         'run_id': run_id,
         'target_id': target_id,
-        'total_trials': len(worker.study.trials),
+        'total_trials': worker._n_trials(),
         'pareto_optimal_trials': len(worker.study.best_trials),
         'status': 'completed'
     }
\ No newline at end of file
@@ -24,23 +24,32 @@ import logging
 import wmill
 import time
 import statistics
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 from requests.exceptions import ConnectionError, Timeout
 
 logger = logging.getLogger(__name__)
 
+# Prometheus connections memoized by URL (see _get_prom_conn)
+_PROM_CONNECTIONS: Dict[str, PrometheusConnect] = {}
+_PROM_CONNECTIONS_LOCK = threading.Lock()
+
+# Sentinel for failed/empty metric collection, built once for the hot path
+_INF = float('inf')
+
 
 def extract_scalar_value(query_result: Dict[str, Any]) -> Optional[float]:
     """Extract scalar value from Prometheus query result"""
-    result = query_result.get('result', [])
-    if len(result) < 2:
+    result = query_result.get('result', ())
+    try:
+        value = result[1]
+    except (IndexError, KeyError, TypeError):
         raise ValueError(f"Invalid scalar result format: {result}")
-    
-    value = result[1]
-    
-    if value == "NaN" or value is None:
+
+    if value is None or value == "NaN":
         return None
-    
+
     return float(value)
 
 
@@ -55,10 +64,10 @@ def aggregate_samples(samples: List[float], method: str = 'median') -> float:
     Returns:
         Aggregated value, or float('inf') if no valid samples exist
     """
-    valid_samples = [s for s in samples if s is not None and s != float('inf')]
-    
+    valid_samples = [s for s in samples if s is not None and s != _INF]
+
     if not valid_samples:
-        return float('inf')
+        return _INF
     
     if method == 'median':
         return statistics.median(valid_samples)
@@ -100,14 +109,14 @@ def prometheus_query_with_retry(prom_conn, query: str, max_retries: int = 3, ini
             last_exception = e
             if attempt < max_retries - 1:
                 delay = initial_delay * (2 ** attempt)
-                logger.warning(f"Query failed (attempt {attempt + 1}/{max_retries}): {e}. Retrying in {delay}s...")
+                logger.warning("Query failed (attempt %s/%s): %s. Retrying in %ss...", attempt + 1, max_retries, e, delay)
                 time.sleep(delay)
             else:
-                logger.error(f"Query failed after {max_retries} retries: {e}")
+                logger.error("Query failed after %s retries: %s", max_retries, e)
                 
         except Exception as e:
             # Non-retryable error
-            logger.error(f"Non-retryable query error: {e}")
+            logger.error("Non-retryable query error: %s", e)
             raise
     
     # All retries exhausted
@@ -120,6 +129,11 @@ def main(config: Dict[str, Any], targets: List[Dict[str, Any]]) -> Dict[str, Any
 
     v0.3: Collects metrics for both objectives (what we optimize) and guardrails (safety limits)
 
+    Metrics are gathered concurrently so that per-metric stabilization waits
+    and query round-trips overlap instead of adding up. The number of
+    in-flight metrics is bounded by reconnaissance.prometheus.concurrency
+    (default 8).
+
     Args:
         config: Breeder configuration with objectives, guardrails, and reconnaissance settings
         targets: List of target systems (unused for Prometheus, but kept for interface consistency)
@@ -134,60 +148,64 @@ def main(config: Dict[str, Any], targets: List[Dict[str, Any]]) -> Dict[str, Any
     global_recon_config = config.get('reconnaissance', {})
     global_prometheus_config = global_recon_config.get('prometheus', {})
     prometheus_url = global_prometheus_config.get('url', 'http://localhost:9090')
-    logger.info(f"Default Prometheus URL: {prometheus_url}")
+    concurrency = max(1, int(global_prometheus_config.get('concurrency', 8)))
+    logger.info("Default Prometheus URL: %s", prometheus_url)
 
-    metric_data = {}
+    # v0.3: Collect metrics for objectives (what we optimize) and guardrails (safety limits)
+    metric_specs = []
+    for kind, entries in (('objective', config.get('objectives', [])),
+                          ('guardrail', config.get('guardrails', []))):
+        for entry in entries:
+            metric_name = entry.get('name')
+            logger.info("Gathering %s metric: %s", kind, metric_name)
 
-    # v0.3: Collect metrics for objectives (what we optimize)
-    for objective in config.get('objectives', []):
-        objective_name = objective.get('name')
-        logger.info(f"Gathering objective metric: {objective_name}")
+            recon_config = entry.get('reconnaissance', {})
 
-        recon_config = objective.get('reconnaissance', {})
+            # Get prometheus URL: per-metric override or global default
+            metric_prometheus_url = recon_config.get('url', prometheus_url)
+            if recon_config.get('url'):
+                logger.info("Using per-%s Prometheus URL: %s", kind, metric_prometheus_url)
 
-        # Get prometheus URL: per-objective override or global default
-        objective_prometheus_url = recon_config.get('url', prometheus_url)
-        if recon_config.get('url'):
-            logger.info(f"Using per-objective Prometheus URL: {objective_prometheus_url}")
+            metric_specs.append((metric_name, metric_prometheus_url, recon_config))
 
-        # Create Prometheus connection for this objective
-        objective_prom_conn = PrometheusConnect(
-            url=objective_prometheus_url,
-            retry=urllib3.util.retry.Retry(total=3, raise_on_status=True, backoff_factor=0.5),
-            disable_ssl=True
-        )
+    metric_data = {}
 
-        value = _gather_single_metric(objective_prom_conn, objective_name, recon_config)
-        metric_data[objective_name] = value
+    if metric_specs:
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(metric_specs))) as executor:
+            values = executor.map(lambda spec: _gather_metric_from_url(*spec), metric_specs)
+            for (metric_name, _, _), value in zip(metric_specs, values):
+                metric_data[metric_name] = value
 
-    # v0.3: Collect metrics for guardrails (safety limits)
-    for guardrail in config.get('guardrails', []):
-        guardrail_name = guardrail.get('name')
-        logger.info(f"Gathering guardrail metric: {guardrail_name}")
+    logger.info("Reconnaissance completed with %s metrics", len(metric_data))
 
-        recon_config = guardrail.get('reconnaissance', {})
+    return {
+        'status': 'completed',
+        'metrics': metric_data
+    }
 
-        # Get prometheus URL: per-guardrail override or global default
-        guardrail_prometheus_url = recon_config.get('url', prometheus_url)
-        if recon_config.get('url'):
-            logger.info(f"Using per-guardrail Prometheus URL: {guardrail_prometheus_url}")
 
-        # Create Prometheus connection for this guardrail
-        guardrail_prom_conn = PrometheusConnect(
-            url=guardrail_prometheus_url,
-            retry=urllib3.util.retry.Retry(total=3, raise_on_status=True, backoff_factor=0.5),
-            disable_ssl=True
-        )
+def _get_prom_conn(prometheus_url: str) -> PrometheusConnect:
+    """
+    Get the shared Prometheus connection for a URL, creating it on first use
 
-        value = _gather_single_metric(guardrail_prom_conn, guardrail_name, recon_config)
-        metric_data[guardrail_name] = value
+    PrometheusConnect keeps a requests session with HTTP keep-alive, so reusing
+    it across metrics and invocations amortizes the TCP/TLS handshake.
+    """
+    with _PROM_CONNECTIONS_LOCK:
+        prom_conn = _PROM_CONNECTIONS.get(prometheus_url)
+        if prom_conn is None:
+            prom_conn = PrometheusConnect(
+                url=prometheus_url,
+                retry=urllib3.util.retry.Retry(total=3, raise_on_status=True, backoff_factor=0.5),
+                disable_ssl=True
+            )
+            _PROM_CONNECTIONS[prometheus_url] = prom_conn
+        return prom_conn
 
-    logger.info(f"Reconnaissance completed with {len(metric_data)} metrics")
 
-    return {
-        'status': 'completed',
-        'metrics': metric_data
-    }
+def _gather_metric_from_url(metric_name: str, prometheus_url: str, recon_config: Dict[str, Any]) -> float:
+    """Gather a single metric using the shared connection for the given URL"""
+    return _gather_single_metric(_get_prom_conn(prometheus_url), metric_name, recon_config)
 
 
 def _gather_single_metric(prom_conn, metric_name: str, recon_config: Dict[str, Any]) -> float:
@@ -215,12 +233,12 @@ def _gather_single_metric(prom_conn, metric_name: str, recon_config: Dict[str, A
 
             # Wait for system stabilization after parameter changes
             if stabilization_seconds > 0:
-                logger.info(f"Waiting {stabilization_seconds}s for network stabilization")
+                logger.info("Waiting %ss for network stabilization", stabilization_seconds)
                 time.sleep(stabilization_seconds)
                 logger.info("Stabilization period completed")
 
-            logger.info(f"Collecting {samples} samples with {interval}s interval")
-            logger.debug(f"Executing Prometheus query: {recon_query}")
+            logger.info("Collecting %s samples with %ss interval", samples, interval)
+            logger.debug("Executing Prometheus query: %s", recon_query)
 
             sample_values = []
 
@@ -234,9 +252,9 @@ def _gather_single_metric(prom_conn, metric_name: str, recon_config: Dict[str, A
                 sample_values.append(value)
 
                 if value is not None:
-                    logger.debug(f"Sample {i+1}/{samples}: {value}")
+                    logger.debug("Sample %s/%s: %s", i+1, samples, value)
                 else:
-                    logger.debug(f"Sample {i+1}/{samples}: NaN")
+                    logger.debug("Sample %s/%s: NaN", i+1, samples)
 
                 # Wait between samples (but not after the last one)
                 if i < samples - 1 and interval > 0:
@@ -248,17 +266,17 @@ def _gather_single_metric(prom_conn, metric_name: str, recon_config: Dict[str, A
             # Aggregate samples
             final_value = aggregate_samples(sample_values, aggregation_method)
 
-            if final_value == float('inf'):
-                logger.warning(f"All samples returned NaN for {metric_name}")
+            if final_value == _INF:
+                logger.warning("All samples returned NaN for %s", metric_name)
                 return final_value
             else:
-                logger.info(f"Metric {metric_name}: {final_value} (using {aggregation_method} of {len([s for s in sample_values if s is not None])} samples)")
+                logger.info("Metric %s: %s (using %s of %s samples)", metric_name, final_value, aggregation_method, len([s for s in sample_values if s is not None]))
                 return final_value
 
         except Exception as e:
-            logger.error(f"Failed to gather metric {metric_name}: {e}")
-            return float('inf')
+            logger.error("Failed to gather metric %s: %s", metric_name, e)
+            return _INF
 
     else:
-        logger.error(f"Unsupported reconnaissance service: {recon_service}")
-        return float('inf')
+        logger.error("Unsupported reconnaissance service: %s", recon_service)
+        return _INF
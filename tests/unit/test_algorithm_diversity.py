@@ -20,6 +20,7 @@
 import pytest
 import sys
 import os
+import time
 from unittest.mock import MagicMock, patch
 
 # Add parent directory to path for imports
@@ -146,7 +147,7 @@ class TestSamplerCreation:
         # Force TPE sampler for this test
         worker.sampler_type = 'tpe'
         
-        with patch('linux_performance.breeder_worker.random.choice') as mock_random:
+        with patch.object(worker._rng, 'choice') as mock_random:
             mock_random.side_effect = [(True, False), True, 10]  # (multivariate, group), constant_liar, n_startup
             
             with patch('linux_performance.breeder_worker.TPESampler') as mock_tpe:
@@ -176,7 +177,7 @@ class TestSamplerCreation:
         # Force NSGA2 sampler for this test
         worker.sampler_type = 'nsga2'
         
-        with patch('linux_performance.breeder_worker.random.choice') as mock_random:
+        with patch.object(worker._rng, 'choice') as mock_random:
             # population_size, mutation_prob, crossover_prob, crossover
             mock_random.side_effect = [50, 0.1, 0.9, 'uniform']
             
@@ -185,6 +186,24 @@ class TestSamplerCreation:
                 
                 assert mock_nsga2.called, "NSGAIISampler should be instantiated"
 
+    @patch('linux_performance.breeder_worker.BreederWorker._load_or_create_study')
+    @patch('linux_performance.breeder_worker.BreederWorker._setup_communication')
+    @patch('linux_performance.breeder_worker.BreederWorker._update_state')
+    def test_sampler_draws_stable_per_run(self, mock_update, mock_comm, mock_study):
+        """Test that profile draws repeat for the same run and differ across runs"""
+        config = {
+            'breeder': {'name': 'test_breeder', 'uuid': 'test_uuid'},
+            'creation_ts': '2025-01-15T10:30:00Z',
+            'run': {'parallel': 2},
+            'objectives': [{'name': 'test_obj', 'direction': 'maximize'}]
+        }
+
+        mock_study.return_value = MagicMock()
+        draws = [BreederWorker({**config, 'run_id': run_id})._rng.random() for run_id in (0, 0, 1)]
+
+        assert draws[0] == draws[1]
+        assert draws[0] != draws[2]
+
 
 class TestStudyNaming:
     """Test study naming for multi-study architecture"""
@@ -259,6 +278,36 @@ class TestCommunicationCallback:
         )
         
         assert callback.share_within_breeder == True
+
+    @pytest.mark.parametrize("probability,expected", [(0.0, False), (1.0, True)])
+    def test_certain_probabilities_skip_draw(self, probability, expected):
+        """Test that probabilities of 0 and 1 decide without drawing a random number"""
+        from linux_performance.breeder_worker import CommunicationCallback
+
+        callback = CommunicationCallback(storage="test_storage", probability=probability)
+        callback._random = MagicMock()
+
+        assert callback._should_share_trial(MagicMock(), MagicMock()) is expected
+        callback._random.assert_not_called()
+
+    @pytest.mark.parametrize("strategy,expected", [
+        ('best', [False, False, False, True, True]),
+        ('worst', [True, True, False, False, False]),
+        ('extremes', [True, True, False, True, True]),
+        ('unknown', [True] * 5),
+    ])
+    def test_strategy_decisions(self, strategy, expected):
+        """Test that each strategy shares the expected part of the value distribution"""
+        from linux_performance.breeder_worker import CommunicationCallback
+
+        callback = CommunicationCallback(storage="test_storage", share_strategy=strategy,
+                                         top_percentile=0.2, bottom_percentile=0.2,
+                                         min_trials_for_filtering=5)
+        callback._values.extend([1.0, 2.0, 3.0, 4.0, 5.0])
+
+        decisions = [callback._should_share_trial(MagicMock(), MagicMock(values=[v]))
+                     for v in (0.5, 1.0, 3.0, 5.0, 6.0)]
+        assert decisions == expected
     
     @patch('linux_performance.breeder_worker.BreederWorker._load_or_create_study')
     @patch('linux_performance.breeder_worker.BreederWorker._update_state')
@@ -281,4 +330,226 @@ class TestCommunicationCallback:
         
         # Check that communication callback is configured for intra-breeder sharing
         assert worker.communication_callback is not None
-        assert worker.communication_callback.share_within_breeder == True
\ No newline at end of file
+        assert worker.communication_callback.share_within_breeder == True
+
+        # Peers are the other sampler-specific studies of this breeder
+        peers = worker.communication_callback._peer_names
+        assert f"test_uuid_{worker.sampler_type}_study" not in peers
+        assert set(peers) <= {f"test_uuid_{s}_study" for s in ('tpe', 'nsga2', 'random')}
+        assert len(peers) == 2
+
+
+class TestCooperatingStudyCache:
+    """Test that cooperating study handles are loaded once and reused"""
+
+    @pytest.fixture
+    def storage_url(self, tmp_path):
+        return f"sqlite:///{tmp_path / 'cooperation.db'}"
+
+    @pytest.fixture
+    def real_optuna(self):
+        # optuna is replaced by MagicMocks in sys.modules above; the breeder
+        # module keeps a reference to the real package, restore it for storage use
+        from linux_performance import breeder_worker
+        optuna_pkg = breeder_worker.optuna
+        real_modules = {
+            'optuna': optuna_pkg,
+            'optuna.storages': optuna_pkg.storages,
+            'optuna.trial': optuna_pkg.trial,
+            'optuna.samplers': optuna_pkg.samplers
+        }
+        with patch.dict(sys.modules, real_modules):
+            yield optuna_pkg
+
+    def _completed_trial(self, real_optuna, study, value):
+        trial = study.ask({'x': real_optuna.distributions.FloatDistribution(0, 10)})
+        study.tell(trial, value)
+        return study.trials[-1]
+
+    def test_trials_shared_with_cooperating_studies(self, storage_url, real_optuna):
+        """Test that a trial is added to every other study in storage"""
+        from linux_performance.breeder_worker import CommunicationCallback
+
+        own = real_optuna.create_study(study_name='b1_tpe_study', storage=storage_url)
+        peer = real_optuna.create_study(study_name='b1_random_study', storage=storage_url)
+
+        callback = CommunicationCallback(storage=storage_url, probability=1.0)
+        callback._share_trials(own, [self._completed_trial(real_optuna, own, 1.0)])
+
+        assert len(peer.trials) == 1
+        assert len(own.trials) == 1
+
+    def test_study_handles_loaded_once(self, storage_url, real_optuna):
+        """Test that repeated shares reuse cached study handles"""
+        from linux_performance.breeder_worker import CommunicationCallback
+
+        own = real_optuna.create_study(study_name='b1_tpe_study', storage=storage_url)
+        peer = real_optuna.create_study(study_name='b1_random_study', storage=storage_url)
+
+        callback = CommunicationCallback(storage=storage_url, probability=1.0)
+
+        with patch.object(real_optuna, 'load_study', wraps=real_optuna.load_study) as mock_load:
+            for value in (1.0, 2.0, 3.0):
+                callback._share_trials(own, [self._completed_trial(real_optuna, own, value)])
+
+        assert mock_load.call_count == 1
+        assert len(peer.trials) == 3
+
+    def test_completed_values_tracked_incrementally(self, real_optuna):
+        """Test that values are counted once, including trials finished after a running one"""
+        from linux_performance.breeder_worker import CommunicationCallback
+
+        study = real_optuna.create_study()
+        callback = CommunicationCallback(storage="unused", share_strategy="best")
+
+        for value in (3.0, 1.0):
+            self._completed_trial(real_optuna, study, value)
+        running = study.ask({'x': real_optuna.distributions.FloatDistribution(0, 10)})
+        self._completed_trial(real_optuna, study, 2.0)
+
+        callback._update_values(study)
+        callback._update_values(study)
+        assert callback._values == [1.0, 2.0, 3.0]
+
+        study.tell(running, 2.0)
+        self._completed_trial(real_optuna, study, 5.0)
+        callback._update_values(study)
+
+        assert callback._values == [1.0, 2.0, 2.0, 3.0, 5.0]
+        assert callback._values_scanned == 5 and not callback._values_ahead
+        # Percentile ranks as scipy.stats.percentileofscore(kind='rank') gives them
+        expected = {0.0: 0.0, 2.0: 50.0, 4.0: 80.0, 5.0: 100.0, float('inf'): 100.0}
+        assert {v: callback._percentile_of(v) for v in expected} == expected
+
+    def test_known_peers_skip_discovery(self, storage_url, real_optuna):
+        """Test that configured peer studies are used without listing the storage"""
+        from linux_performance.breeder_worker import CommunicationCallback
+
+        own = real_optuna.create_study(study_name='b1_tpe_study', storage=storage_url)
+        peer = real_optuna.create_study(study_name='b1_random_study', storage=storage_url)
+        other = real_optuna.create_study(study_name='b2_tpe_study', storage=storage_url)
+
+        callback = CommunicationCallback(storage=storage_url, probability=1.0,
+                                         peer_names=('b1_random_study',))
+
+        with patch.object(real_optuna, 'get_all_study_names') as mock_list:
+            callback._share_trials(own, [self._completed_trial(real_optuna, own, 1.0)])
+
+        mock_list.assert_not_called()
+        assert len(peer.trials) == 1
+        assert len(other.trials) == 0
+
+    def test_discovery_retried_after_storage_error(self, storage_url, real_optuna):
+        """Test that a failed study listing invalidates the cache instead of pinning it"""
+        from linux_performance.breeder_worker import CommunicationCallback
+
+        own = real_optuna.create_study(study_name='b1_tpe_study', storage=storage_url)
+        peer = real_optuna.create_study(study_name='b1_random_study', storage=storage_url)
+
+        callback = CommunicationCallback(storage=storage_url, probability=1.0)
+
+        with patch.object(real_optuna, 'get_all_study_names',
+                          side_effect=[RuntimeError("connection reset"), ['b1_tpe_study', 'b1_random_study']]):
+            callback._share_trials(own, [self._completed_trial(real_optuna, own, 1.0)])
+            assert len(peer.trials) == 0
+
+            callback._share_trials(own, [self._completed_trial(real_optuna, own, 2.0)])
+
+        assert len(peer.trials) == 1
+
+    def test_single_storage_shared(self, storage_url, real_optuna):
+        """Test that discovery and loaded studies share one storage object"""
+        from linux_performance.breeder_worker import CommunicationCallback
+
+        own = real_optuna.create_study(study_name='b1_tpe_study', storage=storage_url)
+        real_optuna.create_study(study_name='b1_random_study', storage=storage_url)
+        real_optuna.create_study(study_name='b1_nsga2_study', storage=storage_url)
+
+        callback = CommunicationCallback(storage=storage_url, probability=1.0)
+
+        with patch.object(real_optuna.storages, 'RDBStorage', wraps=real_optuna.storages.RDBStorage) as mock_rdb:
+            callback._share_trials(own, [self._completed_trial(real_optuna, own, 1.0)])
+
+        assert mock_rdb.call_count == 1
+
+    def test_failed_trial_does_not_block_batch(self, storage_url, real_optuna):
+        """Test that a FAIL trial leading a batch neither drops its COMPLETE trials nor evicts handles"""
+        from linux_performance.breeder_worker import CommunicationCallback
+
+        own = real_optuna.create_study(study_name='b1_tpe_study', storage=storage_url)
+        peer = real_optuna.create_study(study_name='b1_random_study', storage=storage_url)
+
+        failed = own.ask({'x': real_optuna.distributions.FloatDistribution(0, 10)})
+        own.tell(failed, state=real_optuna.trial.TrialState.FAIL)
+        batch = [own.trials[-1],
+                 self._completed_trial(real_optuna, own, 1.0),
+                 self._completed_trial(real_optuna, own, 2.0)]
+        assert batch[0].values is None
+
+        callback = CommunicationCallback(storage=storage_url, probability=1.0)
+        callback._share_trials(own, batch)
+
+        completed = [t.value for t in peer.trials if t.state == real_optuna.trial.TrialState.COMPLETE]
+        assert completed == [1.0, 2.0]
+        assert 'b1_random_study' in callback._studies
+        assert callback._studies_ts is not None
+
+    def test_failing_study_handle_evicted(self, storage_url, real_optuna):
+        """Test that a handle whose trial creation fails is dropped from the cache"""
+        from linux_performance.breeder_worker import CommunicationCallback
+
+        own = real_optuna.create_study(study_name='b1_tpe_study', storage=storage_url)
+        real_optuna.create_study(study_name='b1_random_study', storage=storage_url)
+
+        callback = CommunicationCallback(storage=storage_url, probability=1.0)
+        callback._share_trials(own, [self._completed_trial(real_optuna, own, 1.0)])
+
+        broken = MagicMock()
+        broken.directions = own.directions
+        broken._storage.create_new_trial.side_effect = RuntimeError("study deleted")
+        callback._studies['b1_random_study'] = broken
+        callback._share_trials(own, [self._completed_trial(real_optuna, own, 2.0)])
+
+        broken._storage.create_new_trial.assert_called_once()
+        assert 'b1_random_study' not in callback._studies
+        assert callback._studies_ts is None
+
+    def test_trials_batched_until_flush(self, storage_url, real_optuna):
+        """Test that selected trials are shared in the background in batches of flush_every"""
+        from linux_performance.breeder_worker import CommunicationCallback
+
+        own = real_optuna.create_study(study_name='b1_tpe_study', storage=storage_url)
+        peer = real_optuna.create_study(study_name='b1_random_study', storage=storage_url)
+
+        callback = CommunicationCallback(storage=storage_url, probability=1.0, flush_every=2)
+
+        with patch.object(CommunicationCallback, '_share_trials', autospec=True,
+                          side_effect=CommunicationCallback._share_trials) as mock_share:
+            for value in (1.0, 2.0):
+                callback(own, self._completed_trial(real_optuna, own, value))
+            for _ in range(200):
+                if mock_share.called:
+                    break
+                time.sleep(0.01)
+
+            assert mock_share.call_count == 1
+            assert len(mock_share.call_args.args[2]) == 2
+
+            callback(own, self._completed_trial(real_optuna, own, 3.0))
+            callback.flush()
+
+        assert mock_share.call_count == 2
+        assert len(peer.trials) == 3
+
+    def test_full_queue_drops_oldest(self):
+        """Test that a full share queue makes room by dropping the oldest trial"""
+        from linux_performance.breeder_worker import CommunicationCallback
+
+        callback = CommunicationCallback(storage="test_storage", queue_size=2)
+        callback._sharer = MagicMock()  # keep the background thread from draining
+
+        for number in range(3):
+            callback._enqueue(('study', MagicMock(number=number)))
+
+        queued = [callback._queue.get_nowait()[1].number for _ in range(2)]
+        assert queued == [1, 2]
@@ -160,6 +160,22 @@ class TestCheckGuardrails:
         assert violations[0]['name'] == 'cpu_usage'
         assert violations[0]['actual_value'] == float('inf')
 
+    def test_limits_resolved_once(self, mock_worker):
+        """Test that unusable guardrails are dropped up front and the rest checked per trial"""
+        from linux_performance.breeder_worker import BreederWorker
+
+        mock_worker.config['guardrails'] += [
+            {'name': 'no_limit'},
+            {'name': 'text_limit', 'hard_limit': 'high'}
+        ]
+        mock_worker._guardrail_limits = BreederWorker._build_guardrail_limits(mock_worker)
+
+        assert mock_worker._guardrail_limits == (('cpu_usage', 90.0), ('memory_usage', 85.0))
+
+        violated, violations = BreederWorker._check_guardrails(mock_worker, {'cpu_usage': 95.0})
+        assert violated
+        assert violations == ["Guardrail 'cpu_usage' violated: 95.0 > 90.0"]
+
 
 class TestRollbackStateManagement:
     """Test rollback state management logic"""
@@ -318,6 +334,160 @@ class TestRollbackStateManagement:
         assert updated_state['state'] == 'in_progress'
         assert updated_state['version'] == 2
 
+    def _create_worker(self, study):
+        """Helper to create a worker with rollback enabled, bypassing __init__"""
+        from linux_performance.breeder_worker import BreederWorker
+
+        worker = BreederWorker.__new__(BreederWorker)
+        worker.study = study
+        worker.config = {}
+        worker.target_id = 0
+        worker.rollback_enabled = True
+        worker.rollback_config = {'enabled': True, 'strategy': 'standard'}
+        worker._rollback_strategy = {}
+        worker._rollback_threshold = 3
+        worker._rollback_state = None
+        worker._rollback_dirty = False
+        worker._init_rollback_state()
+        return worker
+
+    def test_healthy_successes_deferred_until_flush(self):
+        """Test that successes on a healthy target are only written on flush"""
+        study = self._create_mock_study()
+        worker = self._create_worker(study)
+        stored = study.user_attrs['rollback_state_target_0']
+
+        worker._handle_successful_trial({'vm.swappiness': 10})
+        worker._handle_successful_trial({'vm.swappiness': 20})
+
+        assert study.user_attrs['rollback_state_target_0'] == stored
+        assert worker._get_rollback_state()['last_successful_params'] == {'vm.swappiness': 20}
+
+        worker._flush_rollback_state()
+        state = json.loads(study.user_attrs['rollback_state_target_0'])
+        assert state['last_successful_params'] == {'vm.swappiness': 20}
+        assert state['version'] == 1
+        assert not worker._rollback_dirty
+
+    def test_failure_transitions_written_immediately(self):
+        """Test that failures and recovery from them are written right away"""
+        study = self._create_mock_study()
+        worker = self._create_worker(study)
+
+        worker._handle_successful_trial({'vm.swappiness': 10})
+        worker._handle_guardrail_violation({'vm.swappiness': 90})
+        state = json.loads(study.user_attrs['rollback_state_target_0'])
+        assert state['consecutive_failures'] == 1
+        assert state['last_successful_params'] == {'vm.swappiness': 10}
+
+        worker._handle_successful_trial({'vm.swappiness': 30})
+        state = json.loads(study.user_attrs['rollback_state_target_0'])
+        assert state['consecutive_failures'] == 0
+        assert state['last_successful_params'] == {'vm.swappiness': 30}
+
+    def test_violation_counted_after_concurrent_update(self):
+        """Test that a violation colliding with another writer is counted on top of its state"""
+        study = self._create_mock_study()
+        worker = self._create_worker(study)
+        state_key = 'rollback_state_target_0'
+
+        worker._handle_guardrail_violation({'vm.swappiness': 90})
+        assert worker._get_rollback_state()['version'] == 1
+
+        external = dict(json.loads(study.user_attrs[state_key]), consecutive_failures=1, version=4)
+        study.user_attrs[state_key] = json.dumps(external)
+
+        worker._handle_guardrail_violation({'vm.swappiness': 90})
+
+        state = json.loads(study.user_attrs[state_key])
+        assert state['consecutive_failures'] == 2
+        assert state['version'] == 5
+
+    def test_deferred_params_kept_after_concurrent_update(self):
+        """Test that a flush losing the version check re-applies the deferred params"""
+        study = self._create_mock_study()
+        worker = self._create_worker(study)
+        state_key = 'rollback_state_target_0'
+
+        worker._get_rollback_state()
+        worker._handle_successful_trial({'vm.swappiness': 10})
+
+        external = dict(json.loads(study.user_attrs[state_key]), state='needs_rollback', version=2)
+        study.user_attrs[state_key] = json.dumps(external)
+
+        worker._flush_rollback_state()
+
+        state = json.loads(study.user_attrs[state_key])
+        assert state['last_successful_params'] == {'vm.swappiness': 10}
+        assert state['state'] == 'needs_rollback'
+        assert state['version'] == 3
+        assert not worker._rollback_dirty
+
+    def test_needs_rollback_set_at_threshold(self):
+        """Test that the violation reaching the threshold marks the target for rollback"""
+        study = self._create_mock_study()
+        worker = self._create_worker(study)
+
+        for _ in range(worker._rollback_threshold):
+            assert not worker._check_needs_rollback()
+            worker._handle_guardrail_violation({'vm.swappiness': 90})
+
+        state = json.loads(study.user_attrs['rollback_state_target_0'])
+        assert state['consecutive_failures'] == 3
+        assert state['state'] == 'needs_rollback'
+        assert worker._check_needs_rollback()
+
+    def test_state_served_from_memory_until_refresh(self):
+        """Test that the stored state is parsed once and re-read only on refresh"""
+        study = self._create_mock_study()
+        worker = self._create_worker(study)
+        state_key = 'rollback_state_target_0'
+
+        assert worker._get_rollback_state()['state'] == 'normal'
+
+        external = dict(json.loads(study.user_attrs[state_key]), state='needs_rollback', version=5)
+        study.user_attrs[state_key] = json.dumps(external)
+        assert worker._get_rollback_state()['state'] == 'normal'
+
+        worker._refresh_rollback_state()
+        assert worker._get_rollback_state()['version'] == 5
+
+        # Callers get copies, the cached state only changes through updates
+        worker._get_rollback_state()['state'] = 'completed'
+        assert worker._get_rollback_state()['state'] == 'needs_rollback'
+
+    def test_unchanged_state_not_rewritten(self):
+        """Test that updates repeating the current state neither write nor bump the version"""
+        study = self._create_mock_study()
+        worker = self._create_worker(study)
+        study.set_user_attr = MagicMock(side_effect=study.set_user_attr)
+
+        worker._handle_successful_trial({'vm.swappiness': 10})
+        worker._flush_rollback_state()
+        worker._handle_successful_trial({'vm.swappiness': 10})
+        worker._flush_rollback_state()
+        worker._update_rollback_state(worker._get_rollback_state())
+
+        assert study.set_user_attr.call_count == 1
+        assert not worker._rollback_dirty
+        assert worker._get_rollback_state()['version'] == 1
+
+    def test_concurrent_update_not_overwritten(self):
+        """Test that a write based on a stale version yields to the stored state"""
+        study = self._create_mock_study()
+        worker = self._create_worker(study)
+        state_key = 'rollback_state_target_0'
+
+        worker._handle_successful_trial({'vm.swappiness': 10})
+
+        external = dict(json.loads(study.user_attrs[state_key]), state='needs_rollback', version=3)
+        study.user_attrs[state_key] = json.dumps(external)
+
+        assert worker._update_rollback_state(worker._get_rollback_state()) is False
+        assert json.loads(study.user_attrs[state_key]) == external
+        assert worker._get_rollback_state()['state'] == 'needs_rollback'
+        assert not worker._rollback_dirty
+
 
 class TestV03ParameterSuggestion:
     """Test parameter suggestion with multiple categories"""
@@ -485,3 +655,145 @@ class TestV03ParameterSuggestion:
         assert 'vm.swappiness' in suggested_params
         assert 'cpu_governor' in suggested_params
         assert len(suggested_params) == 2
+
+    def test_param_plan_flattens_settings(self):
+        """Test that the parameter plan flattens all categories once, skipping unconstrained entries"""
+        from linux_performance.breeder_worker import BreederWorker
+
+        worker = MagicMock()
+        worker.config = {
+            'settings': {
+                'sysctl': {
+                    'vm.swappiness': {'constraints': [{'step': 1, 'lower': 0, 'upper': 100}]},
+                    'vm.dirty_ratio': {}
+                },
+                'ethtool': {
+                    'eth0': {'tso': {'constraints': [{'values': ['on', 'off']}]}}
+                }
+            }
+        }
+
+        plan = BreederWorker._build_param_plan(worker)
+
+        assert [entry[:3] for entry in plan] == [('vm.swappiness', 'vm.swappiness', 'sysctl'),
+                                                 ('eth0_tso', 'tso', 'ethtool.eth0')]
+
+        worker._param_plan = plan
+        trial = MagicMock()
+        trial.suggest_int.return_value = 60
+        trial.suggest_categorical.return_value = 'on'
+        params = BreederWorker._suggest_params(worker, trial)
+
+        trial.suggest_int.assert_called_once_with('vm.swappiness', 0, 100, step=1)
+        trial.suggest_categorical.assert_called_once_with('tso', ['on', 'off'])
+        assert params == {'vm.swappiness': 60, 'eth0_tso': 'on'}
+
+    def test_invalid_constraints_fail_the_trial(self):
+        """Test that invalid constraints fail each trial rather than worker start-up"""
+        from linux_performance.breeder_worker import BreederWorker
+
+        worker = MagicMock()
+        worker.config = {'settings': {'sysctl': {'vm.swappiness': {'constraints': [{'lower': 0}]}}}}
+
+        worker._param_plan = BreederWorker._build_param_plan(worker)
+
+        with pytest.raises(ValueError, match="sysctl.vm.swappiness"):
+            BreederWorker._suggest_params(worker, MagicMock())
+
+
+class TestTrialCount:
+    """Test trial counting against the study storage"""
+
+    def test_count_does_not_copy_trials(self):
+        """Test that the trial count is taken from storage instead of copying study.trials"""
+        from linux_performance.breeder_worker import BreederWorker
+
+        worker = MagicMock()
+        worker.study._storage.get_n_trials.return_value = 42
+        worker.study._study_id = 7
+
+        assert BreederWorker._n_trials(worker) == 42
+        worker.study._storage.get_n_trials.assert_called_once_with(7)
+
+
+class TestBestValueTracking:
+    """Test local best value tracking for single-objective studies"""
+
+    @pytest.mark.parametrize("maximize,values,expected", [
+        (False, [5.0, 7.0, 3.0, 3.0], [True, False, True, False]),
+        (True, [5.0, 7.0, 3.0, 7.0], [True, True, False, False]),
+    ])
+    def test_improves_best_respects_direction(self, maximize, values, expected):
+        """Test that only strict improvements in the objective direction are recorded"""
+        from linux_performance.breeder_worker import BreederWorker
+
+        worker = MagicMock()
+        worker._maximize = maximize
+        worker._best_value = None
+
+        assert [BreederWorker._improves_best(worker, v) for v in values] == expected
+        assert worker._best_value == (7.0 if maximize else 3.0)
+
+    def test_missing_value_not_recorded(self):
+        """Test that a trial told as FAIL for a missing objective value leaves the best alone"""
+        from linux_performance.breeder_worker import BreederWorker, TrialState
+
+        worker = MagicMock()
+        worker._maximize = False
+        worker._best_value = 3.0
+        worker._improves_best = lambda value: BreederWorker._improves_best(worker, value)
+
+        assert not BreederWorker._improves_best(worker, None)
+
+        failed = MagicMock(state=TrialState.FAIL, values=None)
+        BreederWorker._update_best_value(worker, failed)
+
+        completed = MagicMock(state=TrialState.COMPLETE, values=[2.0])
+        BreederWorker._update_best_value(worker, completed)
+
+        worker.metrics.set_best_value.assert_called_once_with(2.0)
+        assert worker._best_value == 2.0
+
+    def test_refresh_picks_up_shared_best(self):
+        """Test that a better value shared in by another worker reaches the gauge"""
+        from linux_performance.breeder_worker import BreederWorker
+
+        worker = MagicMock()
+        worker._maximize = False
+        worker._best_value = 3.0
+        worker._obj_names = ('latency',)
+        worker._improves_best = lambda value: BreederWorker._improves_best(worker, value)
+        worker._study_best_value = lambda: BreederWorker._study_best_value(worker)
+
+        worker.study.best_value = 3.0
+        BreederWorker._refresh_best_value(worker)
+        worker.metrics.set_best_value.assert_not_called()
+
+        worker.study.best_value = 1.5
+        BreederWorker._refresh_best_value(worker)
+        worker.metrics.set_best_value.assert_called_once_with(1.5)
+        assert worker._best_value == 1.5
+
+
+class TestStateUpdates:
+    """Test Windmill state update throttling"""
+
+    @patch('linux_performance.breeder_worker.wmill')
+    def test_unchanged_state_not_rewritten(self, mock_wmill):
+        """Test that an identical state is only written to Windmill once"""
+        from linux_performance.breeder_worker import BreederWorker
+
+        worker = MagicMock()
+        worker.breeder_id = 'breeder-1'
+        worker.study.study_name = 'study'
+        worker._n_trials.return_value = 3
+        worker._last_state = None
+
+        BreederWorker._update_state(worker)
+        BreederWorker._update_state(worker)
+        assert mock_wmill.set_state.call_count == 1
+
+        worker._n_trials.return_value = 4
+        BreederWorker._update_state(worker)
+        assert mock_wmill.set_state.call_count == 2
+        assert mock_wmill.set_state.call_args.args[0]['total_trials'] == 4
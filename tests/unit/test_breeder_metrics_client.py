@@ -7,6 +7,7 @@ Prometheus Push Gateway or Windmill infrastructure.
 
 import sys
 import os
+import time
 from unittest.mock import MagicMock, patch, call
 import pytest
 
@@ -42,7 +43,7 @@ class TestBreederMetricsClientInitialization:
         # Verify registry was created
         mock_registry.assert_called_once()
 
-    @patch.dict(os.environ, {'PUSH_METRICS_ENABLED': 'false'})
+    @patch('linux_performance.breeder_metrics_client._PUSH_ENABLED', False)
     @patch('linux_performance.breeder_metrics_client.CollectorRegistry')
     def test_initialization_disabled(self, mock_registry):
         """Test client respects PUSH_METRICS_ENABLED=false"""
@@ -59,6 +60,25 @@ class TestBreederMetricsClientInitialization:
         # Registry should not be created when disabled
         mock_registry.assert_not_called()
 
+    @patch('linux_performance.breeder_metrics_client._PUSH_ENABLED', False)
+    def test_disabled_methods_are_noops(self):
+        """Test metric methods on a disabled client do nothing"""
+        client = BreederMetricsClient(
+            breeder_id='test-breeder-123',
+            worker_id='test-worker-1',
+            breeder_type='linux_performance'
+        )
+
+        client.mark_running()
+        client.inc_trial('complete', value=0.85)
+        client.observe_trial_duration(1.5)
+        client.inc_guardrail_violation('cpu_usage')
+        client.mark_stopped()
+
+        assert not hasattr(client, '_children')
+        assert client.push() is False
+        assert client.close() is True
+
 
 class TestMetricCreation:
     """Test that Prometheus metrics are created with correct configuration"""
@@ -185,8 +205,30 @@ class TestMetricMethods:
         # Mark as stopped
         client.mark_stopped()
 
-        # Should have 4 more calls (running=0, stopped=1)
-        assert mock_gauge_instance.labels.call_count == 4
+        # Children are cached, so no further labels() lookups (running=0, stopped=1)
+        assert mock_gauge_instance.labels.call_count == 2
+        mock_gauge_instance.labels.return_value.set.assert_called_with(1)
+
+    @patch('linux_performance.breeder_metrics_client.push_to_gateway')
+    @patch('linux_performance.breeder_metrics_client.CollectorRegistry')
+    @patch('linux_performance.breeder_metrics_client.Counter')
+    def test_labelled_children_cached(self, mock_counter, mock_registry, mock_push):
+        """Test labels() is resolved once per metric and label value"""
+        mock_counter_instance = MagicMock()
+        mock_counter.return_value = mock_counter_instance
+
+        client = BreederMetricsClient(
+            breeder_id='test-breeder-123',
+            worker_id='test-worker-1',
+            breeder_type='linux_performance'
+        )
+
+        for _ in range(3):
+            client.inc_trial('complete')
+        client.inc_trial('failed')
+
+        assert mock_counter_instance.labels.call_count == 2
+        assert mock_counter_instance.labels.return_value.inc.call_count == 4
 
 
 class TestPushToGateway:
@@ -212,8 +254,10 @@ class TestPushToGateway:
         # Verify push_to_gateway was called
         mock_push.assert_called_once_with(
             'http://test-pushgateway:9091',
-            job='breeder_test-breeder-123',
-            registry=mock_registry_instance
+            job='godon_breeder',
+            grouping_key={'breeder_id': 'test-breeder-123', 'worker_id': 'test-worker-1'},
+            registry=mock_registry_instance,
+            handler=client._push_handler
         )
         assert result is True
 
@@ -221,9 +265,8 @@ class TestPushToGateway:
     @patch('linux_performance.breeder_metrics_client.CollectorRegistry')
     def test_push_disabled(self, mock_registry, mock_push):
         """Test push() does nothing when disabled"""
-        # Create client with PUSH_METRICS_ENABLED=false via env
-        import os
-        with patch.dict(os.environ, {'PUSH_METRICS_ENABLED': 'false'}):
+        # Create client with PUSH_METRICS_ENABLED=false
+        with patch('linux_performance.breeder_metrics_client._PUSH_ENABLED', False):
             client = BreederMetricsClient(
                 breeder_id='test-breeder-123',
                 worker_id='test-worker-1',
@@ -259,6 +302,87 @@ class TestPushToGateway:
         # Should return False on error
         assert result is False
 
+    @patch('linux_performance.breeder_metrics_client.push_to_gateway')
+    @patch('linux_performance.breeder_metrics_client.CollectorRegistry')
+    def test_push_handler_reuses_session(self, mock_registry, mock_push):
+        """Test the push handler sends through the client's persistent session"""
+        client = BreederMetricsClient(
+            breeder_id='test-breeder-123',
+            worker_id='test-worker-1',
+            breeder_type='linux_performance'
+        )
+        client._session = MagicMock()
+        client._session.request.return_value.status_code = 200
+
+        for _ in range(2):
+            client._push_handler('http://gw/metrics/job/x', 'PUT', 30,
+                                 [('Content-Type', 'text/plain')], b'data')()
+
+        assert client._session.request.call_count == 2
+        client._session.request.assert_called_with(
+            'PUT', 'http://gw/metrics/job/x', data=b'data',
+            headers={'Content-Type': 'text/plain'}, timeout=30
+        )
+
+        client._session.request.return_value.status_code = 500
+        with pytest.raises(IOError):
+            client._push_handler('http://gw/metrics/job/x', 'PUT', 30, [], b'data')()
+
+
+class TestBackgroundPush:
+    """Test coalesced pushes from the background pusher thread"""
+
+    @patch('linux_performance.breeder_metrics_client.push_to_gateway')
+    @patch('linux_performance.breeder_metrics_client.CollectorRegistry')
+    def test_push_deferred_to_close(self, mock_registry, mock_push):
+        """Test push() only schedules and close() flushes pending metrics once"""
+        client = BreederMetricsClient(
+            breeder_id='test-breeder-123',
+            worker_id='test-worker-1',
+            breeder_type='linux_performance',
+            push_interval=3600
+        )
+
+        assert client.push() is True
+        assert client.push() is True
+        mock_push.assert_not_called()
+
+        assert client.close() is True
+        mock_push.assert_called_once()
+
+    @patch('linux_performance.breeder_metrics_client.push_to_gateway')
+    @patch('linux_performance.breeder_metrics_client.CollectorRegistry')
+    def test_periodic_push(self, mock_registry, mock_push):
+        """Test requested pushes are sent by the background thread"""
+        client = BreederMetricsClient(
+            breeder_id='test-breeder-123',
+            worker_id='test-worker-1',
+            breeder_type='linux_performance',
+            push_interval=0.01
+        )
+
+        client.push()
+        for _ in range(100):
+            if mock_push.called:
+                break
+            time.sleep(0.01)
+        client.close()
+
+        mock_push.assert_called_once()
+
+    @patch('linux_performance.breeder_metrics_client.push_to_gateway')
+    @patch('linux_performance.breeder_metrics_client.CollectorRegistry')
+    def test_close_without_pusher(self, mock_registry, mock_push):
+        """Test close() is a no-op for synchronous clients"""
+        client = BreederMetricsClient(
+            breeder_id='test-breeder-123',
+            worker_id='test-worker-1',
+            breeder_type='linux_performance'
+        )
+
+        assert client.close() is True
+        mock_push.assert_not_called()
+
 
 class TestRollbackCounter:
     """Test rollback counter functionality"""
@@ -20,10 +20,14 @@
 import pytest
 import sys
 import os
+import time
+from unittest.mock import MagicMock, patch
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
+from effectuation.ssh import main as ssh_main
+
 
 class TestTargetParsing:
     """Test target configuration parsing and validation"""
@@ -154,4 +158,64 @@ class TestParameterHandling:
         
         assert isinstance(params['string_param'], str)
         assert isinstance(params['int_param'], int)
-        assert isinstance(params['list_param'], list)
\ No newline at end of file
+        assert isinstance(params['list_param'], list)
+
+
+class TestParallelEffectuation:
+    """Test concurrent per-target effectuation"""
+
+    @patch('effectuation.ssh.wmill')
+    def test_all_targets_processed(self, mock_wmill):
+        """Test that every target gets its own playbook run"""
+        mock_wmill.run_script_by_path.return_value = {'success': True}
+
+        targets = [{'id': i, 'address': f'10.0.0.{i}'} for i in range(5)]
+        summary = ssh_main(targets, 'f/playbook', {'vm.swappiness': 10}, max_workers=3)
+
+        assert mock_wmill.run_script_by_path.call_count == 5
+        assert summary['successful_changes'] == 5
+        assert summary['failed_changes'] == 0
+        assert {r['target_id'] for r in summary['results']} == set(range(5))
+
+    @patch('effectuation.ssh.wmill')
+    def test_target_failure_does_not_cancel_siblings(self, mock_wmill):
+        """Test that an exception on one target is isolated to its result"""
+        def run_script(path, args):
+            if args['target_hostname'] == '10.0.0.1':
+                raise RuntimeError("SSH connection refused")
+            return {'success': True}
+
+        mock_wmill.run_script_by_path.side_effect = run_script
+
+        targets = [{'id': i, 'address': f'10.0.0.{i}'} for i in range(3)]
+        summary = ssh_main(targets, 'f/playbook', {})
+
+        assert summary['successful_changes'] == 2
+        assert summary['failed_changes'] == 1
+        failed = [r for r in summary['results'] if not r['success']]
+        assert failed[0]['target_id'] == 1
+        assert 'SSH connection refused' in failed[0]['error']
+
+    @patch('effectuation.ssh.wmill')
+    def test_results_keep_target_order(self, mock_wmill):
+        """Test that results are reported in input order, not completion order"""
+        def run_script(path, args):
+            # Earlier targets finish last
+            time.sleep(0.01 * (5 - int(args['target_hostname'].rsplit('.', 1)[1])))
+            return {'success': True}
+
+        mock_wmill.run_script_by_path.side_effect = run_script
+
+        targets = [{'id': i, 'address': f'10.0.0.{i}'} for i in range(5)]
+        summary = ssh_main(targets, 'f/playbook', {})
+
+        assert [r['target_id'] for r in summary['results']] == list(range(5))
+
+    @patch('effectuation.ssh.wmill')
+    def test_empty_targets(self, mock_wmill):
+        """Test that no targets yields an empty summary"""
+        summary = ssh_main([], 'f/playbook', {})
+
+        mock_wmill.run_script_by_path.assert_not_called()
+        assert summary['targets_count'] == 0
+        assert summary['results'] == []
@@ -25,8 +25,10 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
 from reconnaissance.prometheus import extract_scalar_value, aggregate_samples, _gather_single_metric
+from reconnaissance.prometheus import main as recon_main
 from unittest.mock import MagicMock, patch
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 
 class TestExtractScalarValue:
@@ -342,3 +344,97 @@ class TestGatherSingleMetric:
         assert result == float('inf')
         # Query should not be called for unsupported service
         mock_query.assert_not_called()
+
+
+class TestReconnaissanceMain:
+    """Test metric collection across objectives and guardrails"""
+
+    @patch.dict('reconnaissance.prometheus._PROM_CONNECTIONS', clear=True)
+    @patch('reconnaissance.prometheus.PrometheusConnect')
+    @patch('reconnaissance.prometheus._gather_single_metric')
+    def test_collects_objectives_and_guardrails(self, mock_gather, mock_prom):
+        """Test that every objective and guardrail ends up in the result"""
+        mock_gather.side_effect = lambda conn, name, recon_config: recon_config['value']
+
+        config = {
+            'objectives': [
+                {'name': 'latency', 'reconnaissance': {'value': 1.5}},
+                {'name': 'throughput', 'reconnaissance': {'value': 900.0}}
+            ],
+            'guardrails': [
+                {'name': 'cpu_usage', 'reconnaissance': {'value': 42.0}}
+            ]
+        }
+
+        result = recon_main(config, targets=[])
+
+        assert result['status'] == 'completed'
+        assert result['metrics'] == {'latency': 1.5, 'throughput': 900.0, 'cpu_usage': 42.0}
+        assert mock_gather.call_count == 3
+
+    @patch.dict('reconnaissance.prometheus._PROM_CONNECTIONS', clear=True)
+    @patch('reconnaissance.prometheus.PrometheusConnect')
+    @patch('reconnaissance.prometheus._gather_single_metric')
+    def test_per_metric_url_override(self, mock_gather, mock_prom):
+        """Test that per-metric Prometheus URLs take precedence over the global one"""
+        mock_gather.return_value = 1.0
+
+        config = {
+            'reconnaissance': {'prometheus': {'url': 'http://global:9090'}},
+            'objectives': [
+                {'name': 'latency', 'reconnaissance': {'url': 'http://override:9090'}}
+            ],
+            'guardrails': [
+                {'name': 'cpu_usage', 'reconnaissance': {}}
+            ]
+        }
+
+        recon_main(config, targets=[])
+
+        urls = {c.kwargs['url'] for c in mock_prom.call_args_list}
+        assert urls == {'http://global:9090', 'http://override:9090'}
+
+    @patch.dict('reconnaissance.prometheus._PROM_CONNECTIONS', clear=True)
+    @patch('reconnaissance.prometheus.PrometheusConnect')
+    @patch('reconnaissance.prometheus._gather_single_metric')
+    def test_connection_shared_per_url(self, mock_gather, mock_prom):
+        """Test that metrics on the same Prometheus URL reuse one connection"""
+        mock_gather.return_value = 1.0
+
+        config = {
+            'objectives': [{'name': 'latency'}, {'name': 'throughput'}],
+            'guardrails': [{'name': 'cpu_usage'}]
+        }
+
+        recon_main(config, targets=[])
+        recon_main(config, targets=[])
+
+        mock_prom.assert_called_once()
+        assert mock_gather.call_count == 6
+
+    @patch('reconnaissance.prometheus._gather_single_metric')
+    def test_no_metrics_configured(self, mock_gather):
+        """Test that an empty config yields no metrics"""
+        result = recon_main({}, targets=[])
+
+        assert result['metrics'] == {}
+        mock_gather.assert_not_called()
+
+    @patch.dict('reconnaissance.prometheus._PROM_CONNECTIONS', clear=True)
+    @patch('reconnaissance.prometheus.PrometheusConnect')
+    @patch('reconnaissance.prometheus.ThreadPoolExecutor', wraps=ThreadPoolExecutor)
+    @patch('reconnaissance.prometheus._gather_single_metric')
+    def test_concurrency_bound_configurable(self, mock_gather, mock_executor, mock_prom):
+        """Test that the number of concurrent fetches follows the configured bound"""
+        mock_gather.return_value = 1.0
+
+        config = {
+            'reconnaissance': {'prometheus': {'concurrency': 2}},
+            'objectives': [{'name': 'latency'}, {'name': 'throughput'}],
+            'guardrails': [{'name': 'cpu_usage'}]
+        }
+
+        result = recon_main(config, targets=[])
+
+        mock_executor.assert_called_once_with(max_workers=2)
+        assert len(result['metrics']) == 3